@@ -0,0 +1,229 @@
+"""Headless aggregations behind every chart of the app.
+
+The functions take either a survey DataFrame or a prebuilt ``AggregateCube``
+and return plain DataFrames, so the same statistics can be computed in a
+batch job, written to disk and served to the UI without re-running them:
+
+    python analytics.py data/sample_survey.csv --out precomputed --format parquet
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from cube import DIMENSIONS, AggregateCube, age_band_edges, band_labels
+from metrics import METRICS
+from parallel import worker_count
+from tag_index import build_tag_indexes
+
+
+# Directory of precomputed aggregations the UI serves the unfiltered view from
+PRECOMPUTED_ENV = "SURVEY_PRECOMPUTED_DIR"
+
+
+def as_cube(source):
+    """Cube of a survey DataFrame; cubes and other query backends (e.g. ``SqlSurvey``) pass through."""
+    if isinstance(source, pd.DataFrame):
+        return AggregateCube.build(source, build_tag_indexes(source))
+    return source
+
+
+def top_tags(source, column, n=10, filters=None):
+    """The ``n`` most common tags of a multi-select column as a (tag, count) frame."""
+    return as_cube(source).top(column, n, filters).rename_axis("tag").reset_index()
+
+
+def tag_frequencies(source, column, filters=None):
+    """Every tag of a multi-select column with its count, most common first."""
+    counts = as_cube(source).tag_counts(column, filters)
+    return counts[counts > 0].rename_axis("tag").reset_index()
+
+
+def demographic_breakdown(source, by, filters=None):
+    """Respondent counts grouped by one or more demographic columns, missing values excluded."""
+    return as_cube(source).respondent_counts(by, filters).rename("count").reset_index()
+
+
+def age_breakdown(source, filters=None, edges=None):
+    """Respondent counts per age band, youngest first; bands default to SURVEY_AGE_BANDS."""
+    edges = age_band_edges() if edges is None else edges
+    return as_cube(source).age_band_counts(edges, filters).rename("count").reset_index()
+
+
+# Cube columns derived from a survey column -> that survey column
+DERIVED_COLUMNS = {"CountryCode": "Country"}
+
+
+# Aggregation behind each chart, keyed like the figure cache: name -> (function, arguments)
+AGGREGATIONS = {
+    "language_trends/current": (top_tags, {"column": "LanguageWorkedWith"}),
+    "language_trends/desired": (top_tags, {"column": "LanguageDesireNextYear"}),
+    "database_trends/current": (top_tags, {"column": "DatabaseWorkedWith"}),
+    "database_trends/desired": (top_tags, {"column": "DatabaseDesireNextYear"}),
+    "dashboard/languages": (top_tags, {"column": "LanguageWorkedWith"}),
+    "dashboard/databases": (top_tags, {"column": "DatabaseWorkedWith"}),
+    "dashboard/platforms": (tag_frequencies, {"column": "PlatformWorkedWith"}),
+    "dashboard/web_frameworks": (top_tags, {"column": "WebFrameWorkedWith"}),
+    "future_technology_trends/languages": (top_tags, {"column": "LanguageDesireNextYear"}),
+    "future_technology_trends/databases": (top_tags, {"column": "DatabaseDesireNextYear"}),
+    "future_technology_trends/platforms": (tag_frequencies, {"column": "PlatformDesireNextYear"}),
+    "future_technology_trends/web_frameworks": (top_tags, {"column": "WebFrameDesireNextYear"}),
+    "demographics/gender": (demographic_breakdown, {"by": ["Gender"]}),
+    "demographics/country": (demographic_breakdown, {"by": ["CountryCode", "Country"]}),
+    "demographics/age": (age_breakdown, {}),
+    "demographics/education": (demographic_breakdown, {"by": ["Gender", "EdLevel"]}),
+}
+
+
+def tag_trends(years, column, n=10, filters=None):
+    """Share of respondents per year using the ``n`` most common tags of the latest year.
+
+    ``years`` maps each year to its cube (see ``years.SurveyYears``). Shares
+    rather than counts are returned so years of different sizes compare.
+    """
+    cubes = {year: cube for year, cube in years.cubes.items() if column in cube}
+    if not cubes:
+        return pd.DataFrame({"Year": [], "tag": [], "count": [], "share": []})
+    tags = cubes[max(cubes)].top(column, n, filters).index
+
+    frames = []
+    for year, cube in cubes.items():
+        counts = cube.tag_counts(column, filters).reindex(tags, fill_value=0)
+        respondents = cube.respondents(filters)
+        frames.append(pd.DataFrame({"Year": year, "tag": tags.astype(str), "count": counts.to_numpy(),
+                                    "share": counts.to_numpy() / respondents if respondents else 0.0}))
+    return pd.concat(frames, ignore_index=True)
+
+
+# Aggregations across survey years, computed from per-year cubes rather than a single survey
+TREND_AGGREGATIONS = {
+    "year_over_year/languages": (tag_trends, {"column": "LanguageWorkedWith"}),
+    "year_over_year/databases": (tag_trends, {"column": "DatabaseWorkedWith"}),
+    "year_over_year/platforms": (tag_trends, {"column": "PlatformWorkedWith"}),
+    "year_over_year/web_frameworks": (tag_trends, {"column": "WebFrameWorkedWith"}),
+}
+
+
+def aggregate(source, name, filters=None):
+    """Result of aggregation ``name`` for a survey DataFrame, cube, survey years or precomputed results."""
+    with METRICS.timer("aggregation", name):
+        if isinstance(source, PrecomputedAggregations):
+            return source.get(name, filters)
+        function, kwargs = AGGREGATIONS[name] if name in AGGREGATIONS else TREND_AGGREGATIONS[name]
+        return function(source, filters=filters, **kwargs)
+
+
+def compute_aggregations(source, filters=None):
+    """Every aggregation of the app whose input columns exist in ``source``."""
+    cube = as_cube(source)
+    results = {}
+    for name, (function, kwargs) in AGGREGATIONS.items():
+        if all(column in cube for column in input_columns(name)):
+            results[name] = function(cube, filters=filters, **kwargs)
+    return results
+
+
+def input_columns(name):
+    """Survey columns aggregation ``name`` reads."""
+    _, kwargs = AGGREGATIONS[name] if name in AGGREGATIONS else TREND_AGGREGATIONS[name]
+    if "column" in kwargs:
+        return [kwargs["column"]]
+    # Columns derived when the cube is built stand for the survey column they come from
+    return list(dict.fromkeys(DERIVED_COLUMNS.get(column, column) for column in kwargs.get("by", ["Age"])))
+
+
+def _file_name(name, fmt):
+    return name.replace("/", "__") + "." + fmt
+
+
+def write_aggregations(source, directory, fmt="parquet"):
+    """Compute every unfiltered aggregation and write it to ``directory`` with a manifest."""
+    cube = as_cube(source)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    for name, result in compute_aggregations(cube).items():
+        path = directory / _file_name(name, fmt)
+        if fmt == "parquet":
+            result.to_parquet(path, index=False)
+        else:
+            result.to_json(path, orient="records", indent=2)
+        files[name] = path.name
+
+    manifest = {
+        "version": cube.version,
+        "format": fmt,
+        "columns": cube.columns,
+        "options": {dimension: cube.options(dimension) for dimension in DIMENSIONS},
+        "age_bands": band_labels(age_band_edges()),
+        "aggregations": files,
+    }
+    (directory / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+class PrecomputedAggregations:
+    """Unfiltered aggregations written by ``write_aggregations``, read lazily from disk.
+
+    Exposes the parts of the cube interface the UI needs before any filter is
+    applied (``version``, ``options`` and column membership).
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.manifest = json.loads((self.directory / "manifest.json").read_text())
+        self.version = self.manifest["version"]
+        self.columns = self.manifest["columns"]
+        self._results = {}
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def options(self, dimension):
+        return self.manifest["options"][dimension]
+
+    def current_age_bands(self):
+        """Whether the age chart was written in the bands SURVEY_AGE_BANDS sets now."""
+        try:
+            return self.manifest.get("age_bands") == band_labels(age_band_edges())
+        except ValueError:
+            return False
+
+    def get(self, name, filters=None):
+        if filters and any(filters.values()):
+            raise ValueError("Precomputed aggregations only cover the unfiltered survey.")
+        if name not in self._results:
+            path = self.directory / self.manifest["aggregations"][name]
+            if self.manifest["format"] == "parquet":
+                self._results[name] = pd.read_parquet(path)
+            else:
+                self._results[name] = pd.read_json(path, orient="records", dtype=False)
+        # Pages relabel the columns of what they get, so never hand out the cached frame
+        return self._results[name].copy()
+
+
+def precomputed_dir():
+    return os.environ.get(PRECOMPUTED_ENV)
+
+
+def main(argv=None):
+    from dataset import load_dataset
+
+    parser = argparse.ArgumentParser(description="Compute every chart aggregation of the app.")
+    parser.add_argument("source", help="survey CSV path or URL")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--format", choices=["parquet", "json"], default="parquet")
+    parser.add_argument("--workers", type=int, help="worker processes, 0 for one per core (defaults to SURVEY_WORKERS)")
+    args = parser.parse_args(argv)
+
+    df = load_dataset(args.source)
+    cube = AggregateCube.build(df, build_tag_indexes(df, workers=worker_count(args.workers)))
+    manifest = write_aggregations(cube, args.out, args.format)
+    print(f"Wrote {len(manifest['aggregations'])} aggregations of dataset {manifest['version']} to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
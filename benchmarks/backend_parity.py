@@ -0,0 +1,82 @@
+"""Check that the SQLite backend returns the same aggregations as the aggregate cube.
+
+Every chart aggregation is computed on both backends, unfiltered and under a
+few filter combinations, and compared value by value; the query time of each
+backend is reported alongside. Exits non-zero on any mismatch.
+
+    python benchmarks/backend_parity.py [path-or-url]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from analytics import AGGREGATIONS, aggregate, as_cube  # noqa: E402
+from dataset import SAMPLE_SOURCE, load_dataset  # noqa: E402
+from sql_backend import load_sql_survey  # noqa: E402
+
+
+def filter_cases(cube):
+    """Unfiltered, plus single and combined filters on the most common values."""
+    country = cube.respondent_counts("Country").idxmax()
+    gender = cube.respondent_counts("Gender").idxmax()
+    bands = cube.options("AgeBand")
+    return {
+        "unfiltered": {},
+        "country": {"Country": [country]},
+        "age band": {"AgeBand": bands[1:3]},
+        "country, gender": {"Country": [country], "Gender": [gender]},
+        "no match": {"Country": [country], "AgeBand": ["65+"], "Gender": ["Woman"], "EdLevel": ["Associate degree"]},
+    }
+
+
+def normalized(frame):
+    # Categorical and object columns compare equal once both are plain strings
+    return frame.astype({column: str for column in frame.columns if column not in ("count", "share")})
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default=SAMPLE_SOURCE, help="survey CSV path or URL")
+    args = parser.parse_args(argv)
+
+    df = load_dataset(args.source)
+    cube = as_cube(df)
+    with tempfile.TemporaryDirectory() as directory:
+        survey, seconds = timed(lambda: load_sql_survey(df, directory))
+        print(f"built SQLite database in {seconds:.2f} s")
+
+        mismatches = 0
+        for label, filters in filter_cases(cube).items():
+            totals = {"cube": 0.0, "sqlite": 0.0}
+            for name in AGGREGATIONS:
+                expected, seconds = timed(lambda: aggregate(cube, name, filters))
+                totals["cube"] += seconds
+                actual, seconds = timed(lambda: aggregate(survey, name, filters))
+                totals["sqlite"] += seconds
+                try:
+                    pd.testing.assert_frame_equal(normalized(expected), normalized(actual), check_dtype=False)
+                except AssertionError as error:
+                    mismatches += 1
+                    print(f"MISMATCH {name} [{label}]\n{error}")
+            print(f"{label:<16} cube {totals['cube'] * 1000:8.1f} ms   sqlite {totals['sqlite'] * 1000:8.1f} ms")
+        survey.close()
+
+    print(f"{len(AGGREGATIONS)} aggregations x {len(filter_cases(cube))} filter sets: {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Measure the import cost of every section module with ``python -X importtime``.
+
+Each module is imported in a fresh interpreter; the report lists the total
+import time and which heavy libraries were pulled in, so text sections can
+be checked to stay free of pandas and the plotting stack.
+
+    python benchmarks/import_time.py [--json]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ["streamlit", "sections.text", "sections.languages", "sections.databases",
+           "sections.demographics", "sections.dashboard", "sections.future"]
+
+HEAVY = ["pandas", "plotly", "matplotlib", "seaborn", "wordcloud", "pyarrow"]
+
+
+def import_profile(module):
+    """Total import time in milliseconds and the top-level packages imported by ``module``."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    total_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue
+        total_us += int(self_us)
+        packages.add(name.split(".")[0])
+    return {"module": module, "ms": round(total_us / 1000, 1),
+            "heavy": [package for package in HEAVY if package in packages]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = [import_profile(module) for module in MODULES]
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    for row in report:
+        print(f"{row['module']:<24} {row['ms']:8.1f} ms  {', '.join(row['heavy']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Report the size of the payload every chart sends to the browser.
+
+Each figure is built from the survey's aggregations exactly as the app does
+and serialized like the figure cache stores it (Plotly JSON or PNG bytes);
+for Plotly figures the number of plotted points is listed as well. Survey
+countries missing from the map's ISO-3 table, and so left off the choropleth,
+are listed at the end.
+
+    python benchmarks/payload_size.py [path-or-url] [--json]
+"""
+import argparse
+import base64
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from analytics import aggregate, as_cube  # noqa: E402
+from dataset import SAMPLE_SOURCE, load_dataset  # noqa: E402
+from figure_cache import plotly_payload  # noqa: E402
+from geo import unmapped_countries  # noqa: E402
+from run_benchmarks import SECTIONS  # noqa: E402
+from wordclouds import WORDCLOUDS, render_wordcloud  # noqa: E402
+
+
+def array_length(values):
+    """Length of a Plotly JSON array, plain or encoded as a typed buffer {"dtype", "bdata"}."""
+    if isinstance(values, list):
+        return len(values)
+    return len(base64.b64decode(values["bdata"])) // np.dtype(values["dtype"]).itemsize
+
+
+def plotted_points(payload):
+    """Values sent per trace of a Plotly JSON figure, summed over its traces."""
+    points = 0
+    for trace in json.loads(payload)["data"]:
+        for key in ("x", "locations", "labels", "values"):
+            if key in trace:
+                points += array_length(trace[key])
+                break
+    return points
+
+
+def payload_report(cube, filters=None):
+    filters = filters or {}
+    report = []
+    for section, (module, serialize) in SECTIONS.items():
+        for name, figure in importlib.import_module(module).FIGURES.items():
+            payload = serialize(figure(aggregate(cube, name, filters), filters))
+            row = {"chart": name, "format": "json" if serialize is plotly_payload else "png",
+                   "bytes": len(payload.encode("utf-8") if isinstance(payload, str) else payload)}
+            if serialize is plotly_payload:
+                row["points"] = plotted_points(payload)
+            report.append(row)
+        for name in WORDCLOUDS:
+            if name.startswith(section + "/"):
+                report.append({"chart": name, "format": "png", "bytes": len(render_wordcloud(cube, name, filters))})
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default=SAMPLE_SOURCE, help="survey CSV path or URL")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    cube = as_cube(load_dataset(args.source))
+    report = payload_report(cube)
+    unmapped = unmapped_countries(cube.options("Country"))
+    if args.json:
+        print(json.dumps({"charts": report, "unmapped_countries": unmapped}, indent=2))
+        return
+
+    for row in report:
+        points = row.get("points")
+        print(f"{row['chart']:<42} {row['format']:<5} {row['bytes'] / 1024:9.1f} KiB  "
+              f"{points if points is not None else '-':>6} points")
+    print(f"{'total':<42} {'':<5} {sum(row['bytes'] for row in report) / 1024:9.1f} KiB")
+    print(f"countries left off the map (no ISO-3 code): {', '.join(unmapped) if unmapped else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Render every chart section repeatedly and check that memory stays bounded.
+
+The figure cache is disabled so each run rebuilds every figure; the check
+fails when Matplotlib figures are left open or RSS keeps growing after
+the warm-up runs.
+
+    python benchmarks/render_memory.py --runs 20 --max-growth-mb 25
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "data-analytics-capstone.py"
+
+CHART_SECTIONS = ["📈 Programming Language Trends", "💾 Database Trends", "📊 Dashboard",
+                  "🔮 Future Technology Trend", "👥 Demographics"]
+
+
+def rss_mb():
+    # Resident set size from /proc, falling back to the peak reported by getrusage
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="renders of each chart section")
+    parser.add_argument("--warmup", type=int, default=3, help="renders ignored before measuring")
+    parser.add_argument("--max-growth-mb", type=float, default=25.0, help="allowed RSS growth after warm-up")
+    args = parser.parse_args(argv)
+
+    os.environ["FIGURE_CACHE_MB"] = "0"
+    os.environ.setdefault("SURVEY_DATA_SOURCE", str(ROOT / "data" / "sample_survey.csv"))
+    sys.path.insert(0, str(ROOT))
+
+    import matplotlib.pyplot as plt
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP), default_timeout=300)
+    app.run()
+
+    baseline = None
+    for run in range(args.warmup + args.runs):
+        for section in CHART_SECTIONS:
+            app.sidebar.radio[0].set_value(section)
+            app.run()
+            if app.exception:
+                print(f"{section} raised: {app.exception}")
+                return 1
+        if run == args.warmup - 1 or (args.warmup == 0 and baseline is None):
+            baseline = rss_mb()
+
+    growth = rss_mb() - baseline
+    open_figures = len(plt.get_fignums())
+    print(f"runs: {args.runs}, RSS growth after warm-up: {growth:.1f} MiB, open pyplot figures: {open_figures}")
+    if open_figures or growth > args.max_growth_mb:
+        print("FAIL: figure memory is not bounded")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
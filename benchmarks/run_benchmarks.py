@@ -0,0 +1,235 @@
+"""Time and memory-profile loading, aggregation and figure construction per section.
+
+For every requested size a survey-shaped CSV is synthesized (and reused on
+later runs), then each stage is timed (best of ``--repeat`` runs) and run twice
+more for its memory: once sampling the process RSS and Arrow's allocator
+(which hold the loaded tables), once under tracemalloc for the peak of the
+Python heap alone. Results are written as JSON; two result files can be
+compared with ``--compare``.
+
+    python benchmarks/run_benchmarks.py --sizes 10k 100k 1m --out bench.json
+    python benchmarks/run_benchmarks.py --compare before.json after.json
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import pandas as pd  # noqa: E402
+import pyarrow as pa  # noqa: E402
+
+from analytics import aggregate  # noqa: E402
+from cube import AggregateCube  # noqa: E402
+from dataset import load_dataset, memory_footprint  # noqa: E402
+from figure_cache import plotly_payload, png_payload  # noqa: E402
+from parallel import worker_count  # noqa: E402
+from render_memory import rss_mb  # noqa: E402
+from streaming import DEFAULT_CHUNK_ROWS, stream_cube  # noqa: E402
+from synth import parse_size, write_survey  # noqa: E402
+from tag_index import build_tag_indexes  # noqa: E402
+from wordclouds import WORDCLOUDS, render_wordcloud  # noqa: E402
+
+# Chart sections: name -> (module holding FIGURES, serializer of its figures)
+SECTIONS = {
+    "language_trends": ("sections.languages", plotly_payload),
+    "database_trends": ("sections.databases", plotly_payload),
+    "dashboard": ("sections.dashboard", png_payload),
+    "future_technology_trends": ("sections.future", png_payload),
+    "demographics": ("sections.demographics", plotly_payload),
+}
+
+DEFAULT_SIZES = ["10k", "100k"]
+
+
+@contextmanager
+def sampled_peaks(interval=0.002):
+    """Peak growth of RSS and of Arrow's allocated bytes (MiB) over the block, sampled every ``interval`` s."""
+    rss, arrow = rss_mb(), pa.total_allocated_bytes()
+    peaks = {"rss_peak_mb": 0.0, "arrow_peak_mb": 0.0}
+    done = threading.Event()
+
+    def sample():
+        while True:
+            peaks["rss_peak_mb"] = max(peaks["rss_peak_mb"], rss_mb() - rss)
+            peaks["arrow_peak_mb"] = max(peaks["arrow_peak_mb"], (pa.total_allocated_bytes() - arrow) / 2**20)
+            if done.wait(interval):
+                return
+
+    thread = threading.Thread(target=sample, daemon=True)
+    thread.start()
+    try:
+        yield peaks
+    finally:
+        done.set()
+        thread.join()
+
+
+def measure(function, repeat, setup=None):
+    """Best wall time over ``repeat`` runs, then the memory peaks of two more runs.
+
+    ``rss_peak_mb`` and ``arrow_peak_mb`` cover everything the stage allocates,
+    including Arrow buffers and pandas ``string`` columns; ``heap_peak_mb`` is
+    tracemalloc's peak and only counts Python-heap allocations. ``setup`` runs
+    untimed before every run.
+    """
+    def run():
+        if setup is not None:
+            setup()
+        return function()
+
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    # Separate runs, as tracemalloc's own bookkeeping would inflate the RSS
+    with sampled_peaks() as peaks:
+        run()
+    tracemalloc.start()
+    result = run()
+    _, heap_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {"seconds": round(min(timings), 6), "heap_peak_mb": round(heap_peak / 2**20, 3),
+                    **{key: round(value, 3) for key, value in peaks.items()}}
+
+
+def section_figures(section, cube, filters):
+    """Build and serialize every figure of ``section`` from precomputed aggregations."""
+    module, serialize = SECTIONS[section]
+    figures = importlib.import_module(module).FIGURES
+    data = {name: aggregate(cube, name, filters) for name in figures}
+
+    def build():
+        payloads = [serialize(figure(data[name].copy(), filters)) for name, figure in figures.items()]
+        payloads += [render_wordcloud(cube, name, filters) for name in WORDCLOUDS if name.startswith(section + "/")]
+        return payloads
+
+    return build
+
+
+def section_aggregations(section, cube, filters):
+    names = list(importlib.import_module(SECTIONS[section][0]).FIGURES)
+    names += [name for name in WORDCLOUDS if name.startswith(section + "/")]
+    return lambda: [aggregate(cube, name, filters) for name in names]
+
+
+def benchmark_size(rows, data_dir, repeat, seed, workers=1):
+    path = Path(data_dir) / f"survey-{rows}-{seed}.csv"
+    if not path.exists():
+        print(f"synthesizing {rows:,} rows -> {path}", file=sys.stderr)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_survey(path, rows, seed)
+
+    results = []
+
+    def record(stage, section, stats, **extra):
+        results.append({"rows": rows, "stage": stage, "section": section, **stats, **extra})
+        print(f"{rows:>10,} {stage:<12} {section:<26} {extra.get('filters', ''):<10} "
+              f"{stats['seconds']:9.4f} s {stats['rss_peak_mb']:9.1f} MiB RSS {stats['heap_peak_mb']:9.1f} MiB heap",
+              file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as cache:
+        # Cold load parses the CSV into the Arrow cache (emptied before every run), warm load memory-maps it
+        df, stats = measure(lambda: load_dataset(str(path), cache), 1,
+                            setup=lambda: shutil.rmtree(cache, ignore_errors=True))
+        record("load", "cold", stats, memory_mb=round(memory_footprint(df) / 2**20, 3))
+        df, stats = measure(lambda: load_dataset(str(path), cache), repeat)
+        record("load", "warm", stats)
+
+    indexes, stats = measure(lambda: build_tag_indexes(df, workers=workers), repeat)
+    record("precompute", "tag_index", stats)
+    cube, stats = measure(lambda: AggregateCube.build(df, indexes), repeat)
+    record("precompute", "cube", stats)
+    # Chunked ingest straight into the cube, whose peak should not grow with the survey
+    _, stats = measure(lambda: stream_cube(str(path), DEFAULT_CHUNK_ROWS, workers), 1)
+    record("precompute", "streaming", stats)
+
+    top_country = cube.respondent_counts("Country").idxmax()
+    for label, filters in (("unfiltered", {}), ("filtered", {"Country": [top_country]})):
+        for section in SECTIONS:
+            _, stats = measure(section_aggregations(section, cube, filters), repeat)
+            record("aggregation", section, stats, filters=label)
+            _, stats = measure(section_figures(section, cube, filters), repeat)
+            record("figures", section, stats, filters=label)
+    return results
+
+
+def environment(workers=1):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"), "commit": commit,
+            "python": platform.python_version(), "pandas": pd.__version__, "platform": platform.platform(),
+            "cpus": os.cpu_count(), "workers": workers}
+
+
+def compare(before_path, after_path):
+    """Print the time, RSS and Python-heap peak ratios of every stage present in both result files."""
+    def rows(path):
+        report = json.loads(Path(path).read_text())
+        return {(r["rows"], r["stage"], r["section"], r.get("filters")): r for r in report["results"]}
+
+    def ratio(old, new, field):
+        # Reports written before the RSS sampling only have the heap peak, as "peak_mb"
+        if field == "heap_peak_mb":
+            old, new = old.get(field, old.get("peak_mb")), new.get(field, new.get("peak_mb"))
+        else:
+            old, new = old.get(field), new.get(field)
+        return new / old if old and new is not None else float("nan")
+
+    before, after = rows(before_path), rows(after_path)
+    print(f"{'rows':>10} {'stage':<12} {'section':<26} {'filters':<10} {'time':>8} {'rss':>8} {'heap':>8}")
+    for key in sorted(before.keys() & after.keys(), key=lambda k: (k[0], k[1], k[2], k[3] or "")):
+        old, new = before[key], after[key]
+        ratios = " ".join(f"{ratio(old, new, field):7.2f}x" for field in ("seconds", "rss_peak_mb", "heap_peak_mb"))
+        print(f"{key[0]:>10,} {key[1]:<12} {key[2]:<26} {key[3] or '-':<10} {ratios}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="dataset sizes, e.g. 10k 100k 1m 10m")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for the precompute, 0 for one per core")
+    parser.add_argument("--data-dir", default=str(ROOT / "benchmarks" / "data"), help="where synthetic CSVs are kept")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON reports")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = []
+    for size in args.sizes:
+        results += benchmark_size(parse_size(size), args.data_dir, args.repeat, args.seed, worker_count(args.workers))
+
+    report = json.dumps({"environment": environment(worker_count(args.workers)), "results": results}, indent=2)
+    if args.out:
+        Path(args.out).write_text(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Check that processes sharing one aggregate store build it once and all follow a changed source.
+
+Several processes race on an empty store: exactly one may build the cube and
+all must load the same version. The source is then changed and two
+refreshers sharing the store check it in turn: the first rebuilds, the second
+must swap in the first one's cube without rebuilding. Exits non-zero on any
+failure.
+
+    python benchmarks/shared_store.py --processes 4 [path]
+"""
+import argparse
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import store  # noqa: E402
+from dataset import SAMPLE_SOURCE  # noqa: E402
+from refresh import Refresher  # noqa: E402
+
+
+def counting_builds(builds):
+    """Make ``store.build_aggregates`` count its calls in the shared ``builds`` value."""
+    build_aggregates = store.build_aggregates
+
+    def counted(*args, **kwargs):
+        with builds.get_lock():
+            builds.value += 1
+        return build_aggregates(*args, **kwargs)
+    store.build_aggregates = counted
+
+
+def load_version(source, directory, builds, versions):
+    counting_builds(builds)
+    versions.put(store.load_shared_cube(source, directory).version)
+
+
+def race(source, directory, processes):
+    """Builds and distinct versions loaded by ``processes`` processes starting on an empty store."""
+    context = multiprocessing.get_context("spawn")
+    builds, versions = context.Value("i", 0), context.Queue()
+    workers = [context.Process(target=load_version, args=(source, directory, builds, versions))
+               for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    loaded = {versions.get() for _ in workers}
+    for worker in workers:
+        worker.join()
+    return builds.value, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default=SAMPLE_SOURCE, help="survey CSV path")
+    parser.add_argument("--processes", type=int, default=4, help="processes racing on the empty store")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        source = str(Path(directory) / "survey.csv")
+        shutil.copyfile(args.source, source)
+        shared = Path(directory) / "shared"
+
+        builds, versions = race(source, shared, args.processes)
+        print(f"{args.processes} processes on an empty store: {builds} build(s), versions {sorted(versions)}")
+        failures += builds != 1 or len(versions) != 1
+
+        replicas = [Refresher(source, store.load_shared_cube(source, shared), 60, directory=shared, shared=True)
+                    for _ in range(2)]
+        before = replicas[0].current.respondents()
+        # Appending the survey's rows to itself doubles the respondents and changes its fingerprint
+        with open(args.source) as original, open(source, "a") as changed:
+            changed.writelines(original.readlines()[1:])
+
+        builds = multiprocessing.Value("i", 0)
+        counting_builds(builds)
+        swapped = [replica.check() for replica in replicas]
+        after = [replica.current.respondents() for replica in replicas]
+        print(f"source changed: swapped {swapped}, respondents {before} -> {after}, {builds.value} build(s)")
+        failures += swapped != [True, True] or builds.value != 1 or after[0] != after[1] or after[0] == before
+        failures += replicas[0].current.version != replicas[1].current.version
+        failures += any(replica.check() for replica in replicas)
+
+    print("ok" if not failures else "FAILED")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
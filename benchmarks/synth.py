@@ -0,0 +1,116 @@
+"""Synthesize survey-shaped CSV files for benchmarking.
+
+The files have the demographic columns of ``m1_survey_data.csv`` plus the ten
+semicolon-encoded multi-select columns, with skewed tag popularity and a
+share of missing answers, and are written in chunks so even 10M rows never
+need to fit in memory.
+
+    python benchmarks/synth.py 1m benchmarks/data/survey-1m.csv
+"""
+import argparse
+import csv
+from itertools import compress
+
+import numpy as np
+
+
+VOCABULARIES = {
+    "Language": ["JavaScript", "HTML/CSS", "SQL", "Bash/Shell/PowerShell", "Python", "Java", "C#", "TypeScript",
+                 "PHP", "C++", "C", "Go", "Ruby", "Kotlin", "Swift", "Rust", "R", "Scala", "Objective-C",
+                 "Assembly", "VBA", "Dart", "Elixir", "Clojure", "F#", "WebAssembly", "Erlang", "Other(s):"],
+    "Database": ["MySQL", "Microsoft SQL Server", "PostgreSQL", "SQLite", "MongoDB", "Redis", "Elasticsearch",
+                 "Oracle", "MariaDB", "Firebase", "DynamoDB", "Cassandra", "Couchbase", "Other(s):"],
+    "Platform": ["Windows", "Linux", "Docker", "AWS", "Slack", "Android", "MacOS", "Microsoft Azure",
+                 "Google Cloud Platform", "WordPress", "Heroku", "Kubernetes", "iOS", "Raspberry Pi", "Arduino",
+                 "IBM Cloud or Watson", "Other(s):"],
+    "WebFrame": ["jQuery", "Angular/Angular.js", "React.js", "ASP.NET", "Express", "Spring", "Vue.js", "Django",
+                 "Flask", "Laravel", "Ruby on Rails", "Drupal", "Other(s):"],
+    "MiscTech": ["Node.js", ".NET", ".NET Core", "Pandas", "Unity 3D", "TensorFlow", "React Native", "Ansible",
+                 "Xamarin", "Torch/PyTorch", "Apache Spark", "Hadoop", "Puppet", "Chef", "Flutter", "Cordova",
+                 "CryEngine", "Unreal Engine", "Other(s):"],
+}
+
+COUNTRIES = ["United States", "India", "United Kingdom", "Germany", "Canada", "France", "Brazil", "Poland",
+             "Australia", "Netherlands", "Russian Federation", "Spain", "Italy", "Sweden", "Israel", "Ukraine",
+             "Iran, Islamic Republic of...", "Pakistan", "Turkey", "Switzerland", "Republic of Korea", "Viet Nam",
+             "Hong Kong (S.A.R.)", "Taiwan", "Mexico", "Nigeria", "South Africa", "Japan", "China", "Czech Republic"]
+
+EDUCATION = ["Bachelor’s degree (BA, BS, B.Eng., etc.)", "Master’s degree (MA, MS, M.Eng., MBA, etc.)",
+             "Some college/university study without earning a degree",
+             "Secondary school (e.g. American high school, German Realschule or Gymnasium, etc.)",
+             "Associate degree", "Other doctoral degree (Ph.D, Ed.D., etc.)", "Professional degree (JD, MD, etc.)",
+             "Primary/elementary school", "I never completed any formal education"]
+
+GENDERS = ["Man", "Woman", "Non-binary, genderqueer, or gender non-conforming",
+           "Man;Non-binary, genderqueer, or gender non-conforming"]
+
+COLUMNS = (["Respondent", "Country", "EdLevel"]
+           + [f"{prefix}{suffix}" for prefix in VOCABULARIES for suffix in ("WorkedWith", "DesireNextYear")]
+           + ["Age", "Gender"])
+
+
+def parse_size(text):
+    """Row count from '10000', '100k', '1m' or '10M'."""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1], 1)
+    return int(float(text.rstrip("km")) * scale)
+
+
+def _weights(size, skew):
+    weights = np.linspace(skew, 1, size)
+    return weights / weights.sum()
+
+
+def _multi_select(rng, vocabulary, n, missing):
+    # Tag popularity falls off linearly along the vocabulary
+    probabilities = np.linspace(0.55, 0.03, len(vocabulary))
+    members = rng.random((n, len(vocabulary))) < probabilities
+    values = [";".join(compress(vocabulary, row)) or vocabulary[0] for row in members]
+    for position in np.flatnonzero(rng.random(n) < missing):
+        values[position] = ""
+    return values
+
+
+def synthesize_chunk(rng, start, n):
+    """Rows ``start`` to ``start + n`` of a synthetic survey as a column -> values mapping."""
+    age = np.clip(rng.normal(30, 7, n), 16, 70).round()
+    age[rng.random(n) < 0.03] += 0.5
+    ages = ["" if missing else f"{value:g}" for value, missing in zip(age, rng.random(n) < 0.02)]
+
+    chunk = {
+        "Respondent": np.arange(start, start + n),
+        "Country": rng.choice(COUNTRIES, n, p=_weights(len(COUNTRIES), 10)),
+        "EdLevel": np.where(rng.random(n) < 0.02, "", rng.choice(EDUCATION, n, p=_weights(len(EDUCATION), 100))),
+        "Age": ages,
+        "Gender": np.where(rng.random(n) < 0.01, "", rng.choice(GENDERS, n, p=[0.9, 0.08, 0.015, 0.005])),
+    }
+    for prefix, vocabulary in VOCABULARIES.items():
+        missing = 0.05 if prefix == "Language" else 0.2
+        chunk[f"{prefix}WorkedWith"] = _multi_select(rng, vocabulary, n, missing)
+        chunk[f"{prefix}DesireNextYear"] = _multi_select(rng, vocabulary, n, missing)
+    return chunk
+
+
+def write_survey(path, rows, seed=0, chunk_size=100_000):
+    """Write a synthetic survey of ``rows`` respondents to ``path``."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(COLUMNS)
+        for start in range(0, rows, chunk_size):
+            chunk = synthesize_chunk(rng, start, min(chunk_size, rows - start))
+            writer.writerows(zip(*(chunk[column] for column in COLUMNS)))
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthesize a survey-shaped CSV file.")
+    parser.add_argument("rows", type=parse_size, help="number of respondents, e.g. 10k, 1m")
+    parser.add_argument("path", help="output CSV path")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    write_survey(args.path, args.rows, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+from geo import country_codes
+
+
+# Demographic dimensions the sidebar can filter on
+DIMENSIONS = ["Country", "AgeBand", "EdLevel", "Gender"]
+
+# Comma-separated inner edges of the bands the age chart is drawn in, e.g. "18,25,35,45,55,65"
+AGE_BANDS_ENV = "SURVEY_AGE_BANDS"
+
+
+def band_labels(edges):
+    """Labels of the left-inclusive bands between consecutive ``edges``, e.g. 'Under 18', '18-24', '65+'."""
+    labels = []
+    for low, high in zip(edges[:-1], edges[1:]):
+        if low <= 0:
+            labels.append(f"Under {high:g}")
+        elif np.isinf(high):
+            labels.append(f"{low:g}+")
+        else:
+            labels.append(f"{low:g}-{high - 1:g}")
+    return labels
+
+
+# Age band edges (left-inclusive) and their labels
+AGE_BINS = [0, 18, 25, 35, 45, 55, 65, np.inf]
+AGE_LABELS = band_labels(AGE_BINS)
+
+
+def age_band_edges():
+    """Band edges of the age chart from SURVEY_AGE_BANDS, defaulting to the filter bands; repeated edges count once."""
+    value = os.environ.get(AGE_BANDS_ENV, "").strip()
+    if not value:
+        return AGE_BINS
+    try:
+        inner = {float(edge) for edge in value.split(",") if edge.strip()}
+    except ValueError:
+        inner = None
+    if inner is None or not all(np.isfinite(edge) for edge in inner):
+        raise ValueError(f"Expected comma-separated ages in {AGE_BANDS_ENV}, e.g. 18,25,35, got {value!r}")
+    return [0, *sorted(edge for edge in inner if edge > 0), np.inf]
+
+
+def age_bands(age, edges=AGE_BINS):
+    return pd.cut(age, bins=edges, labels=band_labels(edges), right=False)
+
+
+def band_counts(age_counts, edges=AGE_BINS):
+    """Sum respondent counts per exact age into the bands between ``edges``, every band included."""
+    bands = age_bands(age_counts.index.to_series(), edges)
+    return age_counts.groupby(bands, observed=False).sum().rename_axis("AgeBand")
+
+
+class AggregateCube:
+    """Respondent and tag counts per demographic cell, built once at load.
+
+    ``cells`` holds one row per observed Country x AgeBand x EdLevel x Gender
+    combination (missing values included) with its respondent count, ``ages``
+    the respondent count per cell and exact age, and ``tags`` maps every
+    multi-select column to a long frame of (tag, cell, count). Applying
+    sidebar filters selects cells and re-sums these small frames instead of
+    scanning the respondent table. ``version`` identifies the dataset the
+    cube was built from. Every cell also carries the ISO-3 code of its
+    country, looked up once here rather than on every map render.
+    """
+
+    def __init__(self, cells, ages, tags, columns, version=None):
+        if "CountryCode" not in cells.columns:
+            cells["CountryCode"] = country_codes(cells["Country"])
+        self.cells = cells
+        self.ages = ages
+        self.tags = tags
+        self.columns = columns
+        self.version = version
+
+    @classmethod
+    def build(cls, df, tag_indexes):
+        demo = pd.DataFrame(index=df.index)
+        for dimension in ("Country", "EdLevel", "Gender"):
+            demo[dimension] = df[dimension] if dimension in df.columns else np.nan
+        age = df["Age"] if "Age" in df.columns else pd.Series(np.nan, index=df.index, dtype="float32")
+        demo["AgeBand"] = age_bands(age)
+
+        grouped = demo[DIMENSIONS].groupby(DIMENSIONS, dropna=False, observed=True, sort=False)
+        cell = grouped.ngroup().to_numpy()
+        cells = grouped.size().rename("respondents").reset_index()
+
+        ages = (pd.DataFrame({"cell": cell, "Age": age.to_numpy()})
+                .groupby(["cell", "Age"]).size().rename("respondents").reset_index())
+
+        tags = {}
+        for column, index in tag_indexes.items():
+            frames = []
+            for code in range(len(index.vocabulary)):
+                counts = np.bincount(cell[index.rows(code)], minlength=len(cells))
+                present = np.flatnonzero(counts)
+                frames.append(pd.DataFrame({"tag": code, "cell": present, "count": counts[present]}))
+            frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+                {"tag": [], "cell": [], "count": []})
+            frame["tag"] = pd.Categorical.from_codes(frame["tag"].astype(int), categories=index.vocabulary)
+            tags[column] = frame
+
+        columns = [column for column in df.columns if column in DIMENSIONS + ["Age"] or column in tags]
+        return cls(cells, ages, tags, columns, version=df.attrs.get("version"))
+
+    @classmethod
+    def merge(cls, cubes, version=None):
+        """Combine cubes built from disjoint parts of one survey, e.g. the chunks of a large CSV.
+
+        Cells with the same dimension values are added together, so the result
+        equals the cube built from all parts at once.
+        """
+        cubes = list(cubes)
+        offsets = np.cumsum([0] + [len(cube.cells) for cube in cubes])
+
+        stacked = pd.concat([cube.cells.astype({dimension: object for dimension in DIMENSIONS}) for cube in cubes],
+                            ignore_index=True)
+        grouped = stacked.groupby(DIMENSIONS, dropna=False, sort=False)
+        # New cell of every stacked cell, in order of first appearance like the grouped sums
+        cell = grouped.ngroup().to_numpy()
+        cells = grouped["respondents"].sum().reset_index()
+        for dimension in ("Country", "EdLevel", "Gender"):
+            cells[dimension] = cells[dimension].astype("category")
+        cells["AgeBand"] = pd.Categorical(cells["AgeBand"], categories=AGE_LABELS, ordered=True)
+
+        def remap(frame, offset):
+            return cell[offset + frame["cell"].to_numpy(dtype=np.int64)]
+
+        ages = pd.concat([cube.ages.assign(cell=remap(cube.ages, offset)) for cube, offset in zip(cubes, offsets)],
+                         ignore_index=True)
+        ages = ages.groupby(["cell", "Age"])["respondents"].sum().reset_index()
+
+        tags = {}
+        for column in dict.fromkeys(column for cube in cubes for column in cube.tags):
+            frame = pd.concat([cube.tags[column].astype({"tag": object}).assign(cell=remap(cube.tags[column], offset))
+                               for cube, offset in zip(cubes, offsets) if column in cube.tags], ignore_index=True)
+            frame = frame.groupby(["tag", "cell"])["count"].sum().astype("int64").reset_index()
+            frame["tag"] = pd.Categorical(frame["tag"])
+            tags[column] = frame
+
+        columns = list(dict.fromkeys(column for cube in cubes for column in cube.columns))
+        return cls(cells, ages, tags, columns, version=version)
+
+    def save(self, directory):
+        """Write the cube to ``directory`` as uncompressed Arrow files, returning their names."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        files = {"cells": "cells.arrow", "ages": "ages.arrow"}
+        files.update({column: f"tags-{column}.arrow" for column in self.tags})
+
+        feather.write_feather(self.cells, directory / files["cells"], compression="uncompressed")
+        feather.write_feather(self.ages, directory / files["ages"], compression="uncompressed")
+        for column, frame in self.tags.items():
+            feather.write_feather(frame, directory / files[column], compression="uncompressed")
+        (directory / "cube.json").write_text(json.dumps({"columns": self.columns, "files": files}, indent=2))
+        return list(files.values()) + ["cube.json"]
+
+    @classmethod
+    def load(cls, directory, version=None):
+        """Cube written by ``save``, memory-mapped from ``directory``."""
+        directory = Path(directory)
+        layout = json.loads((directory / "cube.json").read_text())
+        files = layout["files"]
+
+        def read(name):
+            return feather.read_table(directory / files[name], memory_map=True).to_pandas()
+
+        tags = {column: read(column) for column in files if column not in ("cells", "ages")}
+        return cls(read("cells"), read("ages"), tags, layout["columns"], version=version)
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def options(self, dimension):
+        """Values a filter on ``dimension`` can take, in display order."""
+        values = self.cells[dimension]
+        if dimension == "AgeBand":
+            return [label for label in AGE_LABELS if (values == label).any()]
+        return sorted(values.dropna().unique().tolist())
+
+    def selected_cells(self, filters=None):
+        selected = np.ones(len(self.cells), dtype=bool)
+        for dimension, values in (filters or {}).items():
+            if values:
+                selected &= self.cells[dimension].isin(values).to_numpy()
+        return selected
+
+    def tag_counts(self, column, filters=None):
+        """Respondents per tag of ``column`` within the filtered cells, most common first."""
+        frame = self.tags[column]
+        keep = self.selected_cells(filters)[frame["cell"].to_numpy()]
+        counts = np.bincount(frame["tag"].cat.codes.to_numpy()[keep], weights=frame["count"].to_numpy()[keep],
+                             minlength=len(frame["tag"].cat.categories))
+        counts = pd.Series(counts.astype("int64"), index=frame["tag"].cat.categories, name="count")
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def top(self, column, n=10, filters=None):
+        return self.tag_counts(column, filters).head(n)
+
+    def respondents(self, filters=None):
+        """Number of respondents in the filtered cells."""
+        return int(self.cells["respondents"].to_numpy()[self.selected_cells(filters)].sum())
+
+    def respondent_counts(self, by, filters=None):
+        """Respondents grouped by one or more dimensions, missing values excluded."""
+        cells = self.cells[self.selected_cells(filters)]
+        counts = cells.groupby(by, observed=True)["respondents"].sum()
+        return counts[counts > 0]
+
+    def age_band_counts(self, edges=AGE_BINS, filters=None):
+        """Respondents per age band within the filtered cells, every band included."""
+        return band_counts(self.age_counts(filters), edges)
+
+    def age_counts(self, filters=None):
+        """Respondents per exact age within the filtered cells, sorted by age."""
+        selected = self.selected_cells(filters)
+        ages = self.ages[selected[self.ages["cell"].to_numpy()]]
+        counts = ages.groupby("Age")["respondents"].sum()
+        return counts[counts > 0]
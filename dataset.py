@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from tag_index import MULTI_SELECT_COLUMNS
+
+
+# URL of Dataset
+DEFAULT_SOURCE = "https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DA0321EN-SkillsNetwork/LargeData/m1_survey_data.csv"
+
+# Small synthetic survey shipped with the repo for offline runs
+SAMPLE_SOURCE = str(Path(__file__).parent / "data" / "sample_survey.csv")
+
+# Environment variables overriding where the survey comes from and where it is cached
+SOURCE_ENV = "SURVEY_DATA_SOURCE"
+CACHE_DIR_ENV = "SURVEY_CACHE_DIR"
+DEFAULT_CACHE_DIR = ".cache"
+
+# Columns the app reads and the dtypes they are stored with; everything else is never parsed
+SCHEMA = {
+    "Country": "category",
+    "Gender": "category",
+    "EdLevel": "category",
+    "Age": "float32",
+    **{column: "string" for column in MULTI_SELECT_COLUMNS},
+}
+
+
+def data_source():
+    return os.environ.get(SOURCE_ENV, DEFAULT_SOURCE)
+
+
+def cache_dir():
+    return Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+
+
+def cache_key(source):
+    # Keying on the schema too so a schema change never serves a stale file
+    return hashlib.sha1((source + json.dumps(SCHEMA, sort_keys=True)).encode("utf-8")).hexdigest()[:16]
+
+
+def cache_paths(source, directory=None):
+    """Arrow file and manifest paths of the local copy of ``source``."""
+    directory = Path(directory) if directory is not None else cache_dir()
+    key = cache_key(source)
+    return directory / f"survey-{key}.arrow", directory / f"survey-{key}.json"
+
+
+def file_checksum(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_url(source):
+    return urlparse(source).scheme in ("http", "https")
+
+
+def source_fingerprint(source):
+    """Cheap change marker of ``source`` without downloading it, or None when it can't be told.
+
+    URLs are asked for their ETag (or Last-Modified) with a HEAD request, local
+    files give their size and modification time.
+    """
+    try:
+        if is_url(source):
+            with urlopen(Request(source, method="HEAD"), timeout=10) as response:
+                marker = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                return f"{marker}|{response.headers.get('Content-Length', '')}" if marker else None
+        stat = os.stat(source)
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+    except OSError:
+        return None
+
+
+def source_changed(source, manifest):
+    """Whether ``source`` changed since ``manifest`` recorded its fingerprint; unknown (offline) counts as unchanged."""
+    fingerprint = source_fingerprint(source)
+    return fingerprint is not None and fingerprint != manifest.get("fingerprint")
+
+
+def temporary_path(path):
+    """Temporary file next to ``path`` for this process and thread alone, so concurrent writers never share one."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_manifest(path, manifest):
+    # Replacing the file in one step so a reader never sees half a manifest
+    tmp_path = temporary_path(path)
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, path)
+
+
+def read_survey_csv(source, schema=SCHEMA, chunksize=None):
+    """Parse only the ``schema`` columns of the survey, with their declared dtypes.
+
+    Passing ``schema=None`` reads every column with inferred dtypes; passing
+    ``chunksize`` returns an iterator of DataFrames of at most that many rows.
+    """
+    if schema is None:
+        return pd.read_csv(source, chunksize=chunksize)
+    # Columns missing from the file are skipped rather than raising
+    return pd.read_csv(source, usecols=lambda column: column in schema, dtype=schema, chunksize=chunksize)
+
+
+def memory_footprint(df):
+    """Bytes held by ``df``, including the Python objects behind string columns."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def ingest(source, directory=None):
+    """Parse ``source`` once and store it as an uncompressed Arrow file next to a checksum manifest."""
+    arrow_path, manifest_path = cache_paths(source, directory)
+    arrow_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Taken before reading, so a change made while parsing is picked up by the next refresh
+    fingerprint = source_fingerprint(source)
+    df = read_survey_csv(source)
+
+    # Writing to a temporary file first so readers never see a partial file
+    tmp_path = temporary_path(arrow_path)
+    feather.write_feather(df, tmp_path, compression="uncompressed")
+    checksum = file_checksum(tmp_path)
+    os.replace(tmp_path, arrow_path)
+
+    manifest = {"source": source, "fingerprint": fingerprint, "sha256": checksum, "rows": len(df),
+                "columns": list(df.columns), "memory_bytes": memory_footprint(df)}
+    write_manifest(manifest_path, manifest)
+    return manifest
+
+
+def read_manifest(source, directory=None):
+    arrow_path, manifest_path = cache_paths(source, directory)
+    if not arrow_path.exists() or not manifest_path.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except ValueError:
+        return None
+    if manifest.get("sha256") != file_checksum(arrow_path):
+        return None
+    return manifest
+
+
+def load_dataset(source=None, directory=None):
+    """Load the survey from the local Arrow cache, ingesting ``source`` on the first run or once it changed.
+
+    The cached file is validated against its manifest checksum and memory-mapped,
+    so later starts only compare the source's fingerprint and never re-parse an
+    unchanged CSV; offline, the cached copy is used as is.
+    """
+    source = source or data_source()
+    manifest = read_manifest(source, directory)
+    if manifest is None or source_changed(source, manifest):
+        manifest = ingest(source, directory)
+
+    arrow_path, _ = cache_paths(source, directory)
+    df = feather.read_table(arrow_path, memory_map=True).to_pandas()
+    df.attrs["source"] = source
+    df.attrs["version"] = manifest["sha256"][:12]
+    return df
+
+
+def memory_report(source=None):
+    """Footprint of the survey parsed in full versus through the declared schema."""
+    source = source or data_source()
+    full = read_survey_csv(source, schema=None)
+    pruned = read_survey_csv(source)
+    return {
+        "source": source,
+        "full": {"columns": full.shape[1], "bytes": memory_footprint(full)},
+        "schema": {"columns": pruned.shape[1], "bytes": memory_footprint(pruned)},
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    report = memory_report(sys.argv[1] if len(sys.argv) > 1 else None)
+    for name in ("full", "schema"):
+        print(f"{name:>6}: {report[name]['columns']:3d} columns, {report[name]['bytes'] / 2**20:8.1f} MiB")
+    print(f" ratio: {report['schema']['bytes'] / report['full']['bytes']:.1%}")
@@ -0,0 +1,325 @@
+"""Static export of every section of the app for serving the default view without Streamlit.
+
+Each section of ``sections.SECTIONS`` is rendered once, unfiltered, with the
+same section functions the app runs, but with their ``st`` calls recorded
+instead of sent to a browser. The result is a directory a static file server
+can serve as is: one HTML page per section with the Plotly specs embedded
+and the Matplotlib and word cloud figures as PNG files, ``plotly.min.js``,
+and ``bundle.json`` describing every page for other front ends:
+
+    python export.py data/sample_survey.csv --out site
+"""
+import argparse
+import html
+import importlib
+import itertools
+import json
+import re
+import shutil
+import textwrap
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from sections import SECTIONS
+
+
+class StaticPage:
+    """Stand-in for the ``streamlit`` module that records the blocks a section draws."""
+
+    def __init__(self):
+        self.blocks = []
+        self._targets = [self.blocks]
+
+    def _add(self, block):
+        self._targets[-1].append(block)
+
+    def title(self, body, **kwargs):
+        self._add({"type": "title", "text": body})
+
+    def header(self, body, **kwargs):
+        self._add({"type": "header", "text": body})
+
+    def subheader(self, body, **kwargs):
+        self._add({"type": "subheader", "text": body})
+
+    def markdown(self, body, unsafe_allow_html=False, **kwargs):
+        self._add({"type": "html" if unsafe_allow_html else "markdown", "text": body})
+
+    def write(self, body, **kwargs):
+        self.markdown(str(body))
+
+    def caption(self, body, **kwargs):
+        self._add({"type": "caption", "text": body})
+
+    def info(self, body, **kwargs):
+        self._add({"type": "info", "text": body})
+
+    def warning(self, body, **kwargs):
+        self._add({"type": "warning", "text": body})
+
+    def error(self, body, **kwargs):
+        self._add({"type": "error", "text": body})
+
+    def image(self, image, **kwargs):
+        self._add({"type": "image", "png": image})
+
+    def plotly_chart(self, figure, **kwargs):
+        self._add({"type": "plotly", "spec": json.loads(figure.to_json())})
+
+    def columns(self, spec, **kwargs):
+        columns = [[] for _ in range(spec if isinstance(spec, int) else len(spec))]
+        self._add({"type": "columns", "columns": columns})
+        return [StaticColumn(self, blocks) for blocks in columns]
+
+
+class StaticColumn:
+    """Column of a ``StaticPage``, drawn into with ``with column:`` or ``column.<element>(...)``."""
+
+    def __init__(self, page, blocks):
+        self.page = page
+        self.blocks = blocks
+
+    def __enter__(self):
+        self.page._targets.append(self.blocks)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.page._targets.pop()
+
+    def __getattr__(self, name):
+        element = getattr(self.page, name)
+
+        def draw(*args, **kwargs):
+            with self:
+                return element(*args, **kwargs)
+        return draw
+
+
+@contextmanager
+def recording(page, modules):
+    """Point the ``st`` of every module in ``modules`` at ``page`` for the duration of the block."""
+    originals = {module: module.st for module in modules}
+    try:
+        for module in modules:
+            module.st = page
+        yield page
+    finally:
+        for module, original in originals.items():
+            module.st = original
+
+
+def record_section(steps, source, filters=None):
+    """Blocks drawn by the (module, function) ``steps`` of a section from ``source``."""
+    modules = {importlib.import_module(module) for module, _ in steps}
+    if any(module != "sections.text" for module, _ in steps):
+        # The figure helpers draw through the ``st`` of sections.common
+        modules.add(importlib.import_module("sections.common"))
+
+    with recording(StaticPage(), modules) as page:
+        for module, function in steps:
+            render = getattr(importlib.import_module(module), function)
+            if module == "sections.text":
+                render()
+            else:
+                render(source, filters or {})
+    return page.blocks
+
+
+def slug(label):
+    return re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+
+
+def inline_html(text):
+    """HTML of the inline Markdown (bold, italics, code and links) the sections use."""
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
+    text = re.sub(r"`(.+?)`", r"<code>\1</code>", text)
+    return re.sub(r"\[(.+?)\]\((.+?)\)", r'<a href="\2">\1</a>', text)
+
+
+def markdown_html(text):
+    """HTML of the Markdown subset written in the sections: headings, nested lists and paragraphs."""
+    parts, paragraph, lists = [], [], []
+
+    def close_paragraph():
+        if paragraph:
+            parts.append(f"<p>{inline_html(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    def close_lists(indent=-1):
+        while lists and lists[-1] > indent:
+            parts.append("</li></ul>")
+            lists.pop()
+
+    for line in textwrap.dedent(text).splitlines():
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+        heading = re.match(r"(#{1,6})\s+(.*)", stripped)
+        item = re.match(r"[-*•]\s+(.*)", stripped)
+        if not stripped:
+            close_paragraph()
+        elif heading:
+            close_paragraph()
+            close_lists()
+            level = len(heading.group(1))
+            parts.append(f"<h{level}>{inline_html(heading.group(2))}</h{level}>")
+        elif item:
+            close_paragraph()
+            close_lists(indent)
+            if lists and lists[-1] == indent:
+                parts.append("</li><li>")
+            else:
+                parts.append("<ul><li>")
+                lists.append(indent)
+            parts.append(inline_html(item.group(1)))
+        elif lists and indent > lists[-1]:
+            # Continuation line of the current list item
+            parts.append(" " + inline_html(stripped))
+        else:
+            close_lists()
+            paragraph.append(stripped)
+    close_paragraph()
+    close_lists()
+    return "".join(parts)
+
+
+def script_json(value):
+    # "</" would end the surrounding <script> element
+    return json.dumps(value).replace("</", "<\\/")
+
+
+def write_figures(blocks, page_slug, figures_dir, numbers):
+    """Write the PNGs of ``blocks`` to ``figures_dir``, replacing each by its path relative to the site."""
+    for block in blocks:
+        if block["type"] == "image":
+            path = figures_dir / f"{page_slug}-{next(numbers)}.png"
+            path.write_bytes(block.pop("png"))
+            block["src"] = f"{figures_dir.name}/{path.name}"
+        elif block["type"] == "columns":
+            for column in block["columns"]:
+                write_figures(column, page_slug, figures_dir, numbers)
+
+
+def blocks_html(blocks, page_slug, numbers):
+    """HTML of recorded ``blocks``, once their figures are written."""
+    parts = []
+    for block in blocks:
+        kind = block["type"]
+        if kind in ("title", "header", "subheader"):
+            tag = {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+            parts.append(f"<{tag}>{inline_html(block['text'])}</{tag}>")
+        elif kind == "markdown":
+            parts.append(markdown_html(block["text"]))
+        elif kind == "html":
+            parts.append(block["text"])
+        elif kind in ("caption", "info", "warning", "error"):
+            parts.append(f'<div class="{kind}">{markdown_html(block["text"])}</div>')
+        elif kind == "image":
+            parts.append(f'<img src="{block["src"]}" alt="">')
+        elif kind == "plotly":
+            element = f"{page_slug}-plot-{next(numbers)}"
+            parts.append(f'<div id="{element}" class="plotly"></div><script>(function (spec) {{ '
+                         f'Plotly.newPlot("{element}", spec.data, spec.layout, {{responsive: true}}); '
+                         f'}})({script_json(block["spec"])});</script>')
+        elif kind == "columns":
+            columns = "".join(f'<div class="column">{blocks_html(column, page_slug, numbers)}</div>'
+                              for column in block["columns"])
+            parts.append(f'<div class="columns">{columns}</div>')
+        else:
+            raise ValueError(f"Cannot export block of type {kind!r}")
+    return "\n".join(parts)
+
+
+PAGE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title} - Developer Trends</title>
+<script src="plotly.min.js"></script>
+<style>
+body {{ margin: 0; display: flex; font-family: sans-serif; color: #262730; }}
+nav {{ width: 16rem; min-height: 100vh; padding: 1rem; background-color: #f0f2f5; flex-shrink: 0; }}
+nav a {{ display: block; padding: 0.3rem 0; color: inherit; text-decoration: none; }}
+nav a.current {{ font-weight: bold; }}
+main {{ flex-grow: 1; padding: 1rem 3rem; min-width: 0; }}
+.columns {{ display: flex; gap: 2rem; }}
+.column {{ flex: 1; min-width: 0; }}
+img {{ max-width: 100%; }}
+.info, .warning, .error {{ padding: 0.5rem 1rem; border-radius: 0.5rem; background-color: #e8f0fe; }}
+.warning {{ background-color: #fff8e1; }}
+.error {{ background-color: #fdecea; }}
+.caption {{ font-size: 0.85rem; color: #6b6f76; }}
+</style>
+</head>
+<body>
+<nav>
+<h2>Navigation</h2>
+{navigation}
+<p class="caption">Dataset version {version}, exported {exported}.</p>
+</nav>
+<main>
+{content}
+</main>
+</body>
+</html>
+"""
+
+
+def export_site(source, out):
+    """Render every section of the app from ``source`` into a static site in ``out``; returns its manifest."""
+    out = Path(out)
+    figures_dir = out / "figures"
+    # Starting from an empty figures directory so no PNG of a previous export lingers
+    shutil.rmtree(figures_dir, ignore_errors=True)
+    figures_dir.mkdir(parents=True)
+
+    from plotly.offline import get_plotlyjs
+    (out / "plotly.min.js").write_text(get_plotlyjs())
+
+    exported = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
+    pages = [{"label": label, "slug": slug(label), "blocks": record_section(steps, source)}
+             for label, steps in SECTIONS.items()]
+    for page in pages:
+        navigation = "\n".join(f'<a href="{other["slug"]}.html"{" class=current" if other is page else ""}>'
+                               f'{html.escape(other["label"])}</a>' for other in pages)
+        write_figures(page["blocks"], page["slug"], figures_dir, itertools.count(1))
+        content = blocks_html(page["blocks"], page["slug"], itertools.count(1))
+        document = PAGE_HTML.format(title=html.escape(page["label"]), navigation=navigation,
+                                    version=html.escape(str(source.version)), exported=exported, content=content)
+        (out / f"{page['slug']}.html").write_text(document)
+    # The first section is the landing page, like in the app
+    shutil.copyfile(out / f"{pages[0]['slug']}.html", out / "index.html")
+
+    manifest = {"version": source.version, "exported": exported, "pages": pages}
+    (out / "bundle.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main(argv=None):
+    from cube import AggregateCube
+    from dataset import load_dataset
+    from parallel import worker_count
+    from streaming import load_aggregates
+    from tag_index import build_tag_indexes
+
+    parser = argparse.ArgumentParser(description="Export every section of the app as a static HTML/JSON bundle.")
+    parser.add_argument("source", help="survey CSV path or URL")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--chunk-rows", type=int, help="stream the survey in chunks of this many rows")
+    parser.add_argument("--workers", type=int, help="worker processes, 0 for one per core (defaults to SURVEY_WORKERS)")
+    args = parser.parse_args(argv)
+
+    workers = worker_count(args.workers)
+    if args.chunk_rows:
+        cube = load_aggregates(args.source, chunk_rows=args.chunk_rows, workers=workers)
+    else:
+        df = load_dataset(args.source)
+        cube = AggregateCube.build(df, build_tag_indexes(df, workers=workers))
+    manifest = export_site(cube, args.out)
+    print(f"Exported {len(manifest['pages'])} sections of dataset {manifest['version']} to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
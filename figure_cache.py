@@ -0,0 +1,88 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+
+
+# Upper bound of the rendered figures kept in memory, in MiB
+MAX_MB_ENV = "FIGURE_CACHE_MB"
+DEFAULT_MAX_MB = 64
+
+
+def figure_key(name, version, filters):
+    """Cache key of figure ``name`` for a dataset version and filter state.
+
+    Filters are normalised so the order of selected values never causes a miss.
+    """
+    state = tuple(sorted((dimension, tuple(sorted(values))) for dimension, values in (filters or {}).items() if values))
+    return name, version, state
+
+
+def plotly_payload(fig):
+    return fig.to_json()
+
+
+def png_payload(fig):
+    """PNG bytes of a Matplotlib figure, which is cleared afterwards to release its artists."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    fig.clear()
+    return buffer.getvalue()
+
+
+class FigureCache:
+    """Thread-safe LRU of rendered figure payloads bounded by their total size.
+
+    Payloads are Plotly JSON strings or PNG bytes; the least recently used
+    entries are evicted once ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB)) * 2**20)
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key, payload):
+        size = len(payload)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= len(self._entries.pop(key))
+            # A payload larger than the whole budget is returned but never stored
+            if size > self.max_bytes:
+                return payload
+            self._entries[key] = payload
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+        return payload
+
+    def get_or_build(self, key, build):
+        """Cached payload for ``key``, calling ``build()`` to render it on a miss."""
+        payload = self.get(key)
+        if payload is None:
+            payload = self.put(key, build())
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
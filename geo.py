@@ -0,0 +1,67 @@
+import pandas as pd
+
+
+# ISO 3166-1 alpha-3 code of every country name used by the survey, so the choropleth is
+# keyed by code instead of having Plotly resolve names in the browser
+COUNTRY_ISO3 = {
+    "Afghanistan": "AFG", "Albania": "ALB", "Algeria": "DZA", "Andorra": "AND", "Angola": "AGO",
+    "Antigua and Barbuda": "ATG", "Argentina": "ARG", "Armenia": "ARM", "Australia": "AUS", "Austria": "AUT",
+    "Azerbaijan": "AZE", "Bahamas": "BHS", "Bahrain": "BHR", "Bangladesh": "BGD", "Barbados": "BRB",
+    "Belarus": "BLR", "Belgium": "BEL", "Belize": "BLZ", "Benin": "BEN", "Bhutan": "BTN",
+    "Bolivia": "BOL", "Bosnia and Herzegovina": "BIH", "Botswana": "BWA", "Brazil": "BRA",
+    "Brunei Darussalam": "BRN", "Bulgaria": "BGR", "Burkina Faso": "BFA", "Burundi": "BDI",
+    "Cambodia": "KHM", "Cameroon": "CMR", "Canada": "CAN", "Cape Verde": "CPV",
+    "Central African Republic": "CAF", "Chad": "TCD", "Chile": "CHL", "China": "CHN", "Colombia": "COL",
+    "Comoros": "COM", "Congo, Republic of the...": "COG", "Costa Rica": "CRI", "Côte d'Ivoire": "CIV",
+    "Croatia": "HRV", "Cuba": "CUB", "Cyprus": "CYP", "Czech Republic": "CZE",
+    "Democratic People's Republic of Korea": "PRK", "Democratic Republic of the Congo": "COD",
+    "Denmark": "DNK", "Djibouti": "DJI", "Dominica": "DMA", "Dominican Republic": "DOM", "Ecuador": "ECU",
+    "Egypt": "EGY", "El Salvador": "SLV", "Equatorial Guinea": "GNQ", "Eritrea": "ERI", "Estonia": "EST",
+    "Eswatini": "SWZ", "Swaziland": "SWZ", "Ethiopia": "ETH", "Fiji": "FJI", "Finland": "FIN",
+    "France": "FRA", "Gabon": "GAB", "Gambia": "GMB", "Georgia": "GEO", "Germany": "DEU", "Ghana": "GHA",
+    "Greece": "GRC", "Grenada": "GRD", "Guatemala": "GTM", "Guinea": "GIN", "Guinea-Bissau": "GNB",
+    "Guyana": "GUY", "Haiti": "HTI", "Honduras": "HND", "Hong Kong (S.A.R.)": "HKG", "Hungary": "HUN",
+    "Iceland": "ISL", "India": "IND", "Indonesia": "IDN", "Iran, Islamic Republic of...": "IRN",
+    "Iraq": "IRQ", "Ireland": "IRL", "Israel": "ISR", "Italy": "ITA", "Jamaica": "JAM", "Japan": "JPN",
+    "Jordan": "JOR", "Kazakhstan": "KAZ", "Kenya": "KEN", "Kiribati": "KIR", "Kuwait": "KWT",
+    "Kyrgyzstan": "KGZ", "Lao People's Democratic Republic": "LAO", "Latvia": "LVA", "Lebanon": "LBN",
+    "Lesotho": "LSO", "Liberia": "LBR", "Libyan Arab Jamahiriya": "LBY", "Libya": "LBY",
+    "Liechtenstein": "LIE", "Lithuania": "LTU", "Luxembourg": "LUX", "Madagascar": "MDG", "Malawi": "MWI",
+    "Malaysia": "MYS", "Maldives": "MDV", "Mali": "MLI", "Malta": "MLT", "Marshall Islands": "MHL",
+    "Mauritania": "MRT", "Mauritius": "MUS", "Mexico": "MEX", "Micronesia, Federated States of...": "FSM",
+    "Monaco": "MCO", "Mongolia": "MNG", "Montenegro": "MNE", "Morocco": "MAR", "Mozambique": "MOZ",
+    "Myanmar": "MMR", "Namibia": "NAM", "Nauru": "NRU", "Nepal": "NPL", "Netherlands": "NLD",
+    "New Zealand": "NZL", "Nicaragua": "NIC", "Niger": "NER", "Nigeria": "NGA", "North Korea": "PRK",
+    "North Macedonia": "MKD", "The former Yugoslav Republic of Macedonia": "MKD", "Norway": "NOR",
+    "Oman": "OMN", "Pakistan": "PAK", "Palau": "PLW", "Palestine": "PSE", "Panama": "PAN",
+    "Papua New Guinea": "PNG", "Paraguay": "PRY", "Peru": "PER", "Philippines": "PHL", "Poland": "POL",
+    "Portugal": "PRT", "Qatar": "QAT", "Republic of Korea": "KOR", "South Korea": "KOR",
+    "Republic of Moldova": "MDA", "Romania": "ROU", "Russian Federation": "RUS", "Rwanda": "RWA",
+    "Saint Kitts and Nevis": "KNA", "Saint Lucia": "LCA", "Saint Vincent and the Grenadines": "VCT",
+    "Samoa": "WSM", "San Marino": "SMR", "Sao Tome and Principe": "STP", "Saudi Arabia": "SAU",
+    "Senegal": "SEN", "Serbia": "SRB", "Seychelles": "SYC", "Sierra Leone": "SLE", "Singapore": "SGP",
+    "Slovakia": "SVK", "Slovenia": "SVN", "Solomon Islands": "SLB", "Somalia": "SOM",
+    "South Africa": "ZAF", "South Sudan": "SSD", "Spain": "ESP", "Sri Lanka": "LKA", "Sudan": "SDN",
+    "Suriname": "SUR", "Sweden": "SWE", "Switzerland": "CHE", "Syrian Arab Republic": "SYR",
+    "Taiwan": "TWN", "Tajikistan": "TJK", "Thailand": "THA", "Timor-Leste": "TLS", "Togo": "TGO",
+    "Tonga": "TON", "Trinidad and Tobago": "TTO", "Tunisia": "TUN", "Turkey": "TUR", "Turkmenistan": "TKM",
+    "Tuvalu": "TUV", "Uganda": "UGA", "Ukraine": "UKR", "United Arab Emirates": "ARE",
+    "United Kingdom": "GBR", "United Republic of Tanzania": "TZA", "United States": "USA",
+    "Uruguay": "URY", "Uzbekistan": "UZB", "Vanuatu": "VUT",
+    "Venezuela, Bolivarian Republic of...": "VEN", "Viet Nam": "VNM", "Yemen": "YEM", "Zambia": "ZMB",
+    "Zimbabwe": "ZWE",
+}
+
+
+def country_codes(countries):
+    """ISO-3 codes of a Series of survey country names, missing for names not in the table.
+
+    Categorical input is mapped once per category rather than once per row.
+    """
+    # Re-categorizing so the categories sort by code rather than in the order of the country names
+    return countries.map(COUNTRY_ISO3).astype(object).astype("category")
+
+
+def unmapped_countries(countries):
+    """Survey country names the lookup table has no code for."""
+    return sorted(set(pd.Series(countries).dropna()) - COUNTRY_ISO3.keys())
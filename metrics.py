@@ -0,0 +1,138 @@
+"""Process-wide timings and cache counters of the app.
+
+Every timed step (section render, dataset load, aggregation, figure build) is
+recorded as an event tagged with the thread it ran on, so one rerun's events
+can be told apart from concurrent sessions, and folded into cumulative
+totals. The totals can be written as Prometheus text or JSON for monitoring:
+
+    SURVEY_METRICS_FILE=/var/lib/node_exporter/survey.prom
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# File the metrics are written to after every rerun: *.json (snapshot), *.jsonl (one line per rerun)
+# or anything else for the Prometheus text format
+METRICS_FILE_ENV = "SURVEY_METRICS_FILE"
+
+# Set to 1 to show the timings of every rerun in a sidebar panel
+DEBUG_PANEL_ENV = "SURVEY_DEBUG_PANEL"
+
+
+class Metrics:
+    """Thread-safe timings per (kind, name) and counters per (counter, name), plus a bounded event log."""
+
+    def __init__(self, max_events=10_000):
+        self.timings = {}
+        self.counters = {}
+        self.started = time.time()
+        self._events = deque(maxlen=max_events)
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def observe(self, kind, name, seconds):
+        with self._lock:
+            count, total, longest, _ = self.timings.get((kind, name), (0, 0.0, 0.0, 0.0))
+            self.timings[(kind, name)] = (count + 1, total + seconds, max(longest, seconds), seconds)
+            self._sequence += 1
+            self._events.append((self._sequence, threading.get_ident(), kind, name, seconds))
+
+    @contextmanager
+    def timer(self, kind, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(kind, name, time.perf_counter() - start)
+
+    def increment(self, counter, name, by=1):
+        with self._lock:
+            self.counters[(counter, name)] = self.counters.get((counter, name), 0) + by
+
+    def mark(self):
+        """Position in the event log; pass it to ``events`` to get what happened since."""
+        with self._lock:
+            return self._sequence
+
+    def events(self, since=0, thread=None):
+        """(kind, name, seconds) of the events after ``since`` on ``thread`` (defaults to this thread)."""
+        thread = threading.get_ident() if thread is None else thread
+        with self._lock:
+            return [(kind, name, seconds) for sequence, ident, kind, name, seconds in self._events
+                    if sequence > since and ident == thread]
+
+    def lookup(self, name, loader):
+        """Call a Streamlit-cached ``loader`` and count a cache hit, or a miss when its body timed a 'load' of ``name``."""
+        since = self.mark()
+        result = loader()
+        missed = any(kind == "load" and event == name for kind, event, _ in self.events(since))
+        self.increment("cache_misses" if missed else "cache_hits", name)
+        return result
+
+    def snapshot(self):
+        with self._lock:
+            timings = [{"kind": kind, "name": name, "count": count, "seconds_total": total, "seconds_max": longest,
+                        "seconds_last": last} for (kind, name), (count, total, longest, last) in self.timings.items()]
+            counters = [{"counter": counter, "name": name, "value": value}
+                        for (counter, name), value in self.counters.items()]
+        return {"started": self.started, "timings": timings, "counters": counters}
+
+    def prometheus(self):
+        """The cumulative metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = ["# HELP survey_step_seconds Time spent per app step.", "# TYPE survey_step_seconds summary"]
+        for row in snapshot["timings"]:
+            labels = _labels(kind=row["kind"], name=row["name"])
+            lines.append(f"survey_step_seconds_count{labels} {row['count']}")
+            lines.append(f"survey_step_seconds_sum{labels} {row['seconds_total']:.6f}")
+        lines += ["# HELP survey_step_seconds_max Longest time of an app step.", "# TYPE survey_step_seconds_max gauge"]
+        for row in snapshot["timings"]:
+            lines.append(f"survey_step_seconds_max{_labels(kind=row['kind'], name=row['name'])} {row['seconds_max']:.6f}")
+        for counter in sorted({row["counter"] for row in snapshot["counters"]}):
+            lines += [f"# HELP survey_{counter}_total Cache {counter.split('_')[-1]} per cache.",
+                      f"# TYPE survey_{counter}_total counter"]
+            for row in snapshot["counters"]:
+                if row["counter"] == counter:
+                    lines.append(f"survey_{counter}_total{_labels(cache=row['name'])} {row['value']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, since=None):
+        """Write the metrics to ``path``; a *.jsonl file gets one line with this thread's events since ``since``."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".jsonl":
+            events = [{"kind": kind, "name": name, "seconds": seconds} for kind, name, seconds in self.events(since or 0)]
+            with open(path, "a") as handle:
+                handle.write(json.dumps({"time": time.time(), "events": events}) + "\n")
+            return path
+
+        text = json.dumps(self.snapshot(), indent=2) if path.suffix == ".json" else self.prometheus()
+        # Replacing the file in one step so a scraper never reads half of it. The temporary file is
+        # named after this process and thread, as concurrent sessions export at the same time.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+        return path
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+# Metrics of this process, shared by every session
+METRICS = Metrics()
+
+
+def metrics_file():
+    return os.environ.get(METRICS_FILE_ENV) or None
+
+
+def debug_panel_enabled():
+    return os.environ.get(DEBUG_PANEL_ENV, "0") not in ("", "0")
@@ -0,0 +1,42 @@
+"""Process pool shared by the precompute steps.
+
+The multi-select columns and the chunks of a streamed survey are independent,
+so they are encoded in worker processes. Results always come back in input
+order, which keeps every merge deterministic whatever the worker count.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Worker processes used for precomputing aggregates: a number, or 0 for one per core (defaults to 1, no pool)
+WORKERS_ENV = "SURVEY_WORKERS"
+
+
+def worker_count(value=None):
+    """Worker count from ``value`` or SURVEY_WORKERS; 0 means one per core."""
+    if value is None:
+        value = os.environ.get(WORKERS_ENV, "").strip() or 1
+    workers = int(value)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def ordered_map(function, items, workers=1, prefetch=2):
+    """``map(function, items)`` over a process pool, yielding results in input order.
+
+    At most ``workers * prefetch`` items are in flight, so a lazy iterable such
+    as a chunked CSV reader is never read far ahead of the results consumed.
+    With one worker everything runs in this process.
+    """
+    if workers <= 1:
+        yield from map(function, items)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(function, item))
+            if len(pending) >= workers * prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
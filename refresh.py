@@ -0,0 +1,129 @@
+"""Background refresh of the survey snapshot the charts are served from.
+
+A ``Refresher`` polls the source's fingerprint (ETag or Last-Modified of a
+URL, size and mtime of a file) against the one recorded in the local cache
+manifest. When the source changed, it re-ingests the survey and builds the new
+aggregate cube on its own thread, then publishes it by replacing a single
+reference, so requests keep reading the previous snapshot until the new one
+is complete and never wait for a reload.
+"""
+import json
+import logging
+import os
+import threading
+
+from cube import AggregateCube
+from dataset import cache_paths, ingest, load_dataset, source_changed, source_fingerprint
+from metrics import METRICS
+from sql_backend import load_sql_survey
+from store import load_shared_cube
+from streaming import aggregates_dir, ingest_aggregates, load_aggregates
+from tag_index import build_tag_indexes
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the survey source for a new export; unset or 0 disables the refresher
+REFRESH_ENV = "SURVEY_REFRESH_SECONDS"
+
+
+def refresh_interval():
+    value = os.environ.get(REFRESH_ENV, "").strip()
+    return float(value) if value and float(value) > 0 else None
+
+
+class Refresher:
+    """Current cube snapshot of ``source``, swapped for a rebuilt one whenever the source changes.
+
+    ``chunk_rows`` selects the streaming ingest (see ``streaming.py``) like
+    SURVEY_CHUNK_ROWS does for the initial load, and ``shared`` rebuilds
+    through the shared store (see ``store.py``) in ``directory``, so only one
+    of the processes sharing it re-ingests a changed source. ``sqlite``
+    rebuilds the SQLite backend (see ``sql_backend.py``) instead of a cube.
+    """
+
+    def __init__(self, source, current, interval, directory=None, chunk_rows=None, workers=1, shared=False,
+                 sqlite=False):
+        self.source = source
+        self.current = current
+        self.interval = interval
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.workers = workers
+        self.shared = shared
+        self.sqlite = sqlite
+        self.swaps = 0
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def manifest_path(self):
+        if (self.chunk_rows or self.shared) and not self.sqlite:
+            return aggregates_dir(self.source, self.directory) / "manifest.json"
+        return cache_paths(self.source, self.directory)[1]
+
+    def changed(self, manifest):
+        """Whether the source's fingerprint differs from the one recorded in ``manifest``."""
+        return source_changed(self.source, manifest)
+
+    def is_stale(self):
+        """Whether the source changed since the cached snapshot was built from it.
+
+        In the shared store the snapshot is also stale once another process
+        rebuilt the aggregates, since its manifest then already records the
+        new fingerprint; ``rebuild`` then only loads the stored cube.
+        """
+        try:
+            manifest = json.loads(self.manifest_path().read_text())
+        except (OSError, ValueError):
+            return source_fingerprint(self.source) is not None
+        if self.shared and manifest.get("version") != getattr(self.current, "version", None):
+            return True
+        return self.changed(manifest)
+
+    def rebuild(self):
+        """Ingest the source again and build its cube, without touching the published snapshot."""
+        if self.sqlite:
+            ingest(self.source, self.directory)
+            return load_sql_survey(load_dataset(self.source, self.directory), self.directory)
+        if self.shared:
+            # Another process may have rebuilt the store since this one noticed the change
+            return load_shared_cube(self.source, self.directory, self.chunk_rows, self.workers)
+        if self.chunk_rows:
+            ingest_aggregates(self.source, self.directory, self.chunk_rows, self.workers)
+            return load_aggregates(self.source, self.directory, self.chunk_rows, self.workers)
+        ingest(self.source, self.directory)
+        df = load_dataset(self.source, self.directory)
+        return AggregateCube.build(df, build_tag_indexes(df, workers=self.workers))
+
+    def check(self):
+        """Rebuild and swap in a new snapshot if the source changed; returns whether it did."""
+        if not self.is_stale():
+            return False
+        with METRICS.timer("load", "refresh"):
+            snapshot = self.rebuild()
+        # A single assignment, so readers see either the old or the new cube. The old one is released once
+        # the reruns still reading it are done (a SQLite snapshot then closes its connection).
+        self.current = snapshot
+        self.swaps += 1
+        logger.info("Swapped in survey snapshot %s of %s", snapshot.version, self.source)
+        return True
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+                self.last_error = None
+            except Exception as error:  # keep serving the previous snapshot
+                self.last_error = error
+                logger.exception("Refreshing %s failed", self.source)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="survey-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,16 @@
+# Section label -> (module, function) rendered in order. Modules are imported on demand so text
+# sections never pull in pandas or the plotting libraries, and never load the dataset.
+SECTIONS = {
+    "📖 Introduction": [("sections.text", "introduction")],
+    "🛠️ Methodology": [("sections.text", "methodology")],
+    "📊 Results": [("sections.text", "results")],
+    "📈 Programming Language Trends": [("sections.languages", "language_trends"), ("sections.text", "findings_and_implications")],
+    "💾 Database Trends": [("sections.databases", "database_trends"), ("sections.text", "database_findings_and_implications")],
+    "📊 Dashboard": [("sections.dashboard", "dashboard")],
+    "🔮 Future Technology Trend": [("sections.future", "future_technology_trends")],
+    "📅 Year-over-Year Trends": [("sections.trends", "year_over_year")],
+    "👥 Demographics": [("sections.demographics", "demographics")],
+    "🏠 Executive Summary": [("sections.text", "executive_summary")],
+    "📝 Concluding Remarks": [("sections.text", "concluding_remarks")],
+    "🔚 Conclusion": [("sections.text", "conclusion")],
+}
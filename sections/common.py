@@ -0,0 +1,167 @@
+import os
+
+import streamlit as st
+import plotly.io as pio
+
+from analytics import PrecomputedAggregations, aggregate, precomputed_dir
+from cube import AggregateCube
+from dataset import data_source, is_url, load_dataset
+from figure_cache import FigureCache, figure_key, plotly_payload, png_payload
+from metrics import METRICS
+from parallel import worker_count
+from refresh import Refresher, refresh_interval
+from sql_backend import backend, load_sql_survey
+from store import load_shared_cube, shared_dir
+from streaming import DEFAULT_CHUNK_ROWS, chunk_rows, load_aggregates
+from tag_index import build_tag_indexes
+from wordclouds import render_wordcloud, start_prerender
+from years import load_years
+
+
+# URL or local path of Dataset (SURVEY_DATA_SOURCE overrides the course URL)
+url = data_source()
+
+# Aggregating tag and respondent counts per demographic cell, so filters never re-scan the survey.
+# SURVEY_BACKEND=sqlite answers the same queries from an indexed SQLite database instead.
+# With SURVEY_SHARED_DIR the cube is read from the store shared by all app processes (built by the first
+# one to start), and with SURVEY_CHUNK_ROWS the survey is streamed in chunks straight into its aggregates.
+# The respondent table and tag indexes are only needed to build it, so neither is kept in a cache.
+# Errors are raised rather than cached, so the next rerun tries again (see current_cube).
+@st.cache_resource
+def load_cube():
+    with METRICS.timer("load", "load_cube"):
+        if backend() == "sqlite":
+            return load_sql_survey(load_dataset(url))
+        if shared_dir():
+            return load_shared_cube(url, shared_dir(), chunk_rows(), worker_count())
+        if chunk_rows():
+            return load_aggregates(url, chunk_rows=chunk_rows(), workers=worker_count())
+        df = load_dataset(url)
+        return AggregateCube.build(df, build_tag_indexes(df, workers=worker_count()))
+
+# Re-checking the source every SURVEY_REFRESH_SECONDS and swapping in a rebuilt cube off the request path
+@st.cache_resource
+def load_refresher():
+    interval = refresh_interval()
+    if interval is None:
+        return None
+    sqlite = backend() == "sqlite"
+    refresher = Refresher(url, load_cube(), interval, directory=None if sqlite else shared_dir(),
+                          chunk_rows=chunk_rows(), workers=worker_count(), shared=shared_dir() is not None and not sqlite,
+                          sqlite=sqlite)
+    # The refresher owns the snapshot from now on, so the cache doesn't keep the first one alive after a swap
+    load_cube.clear()
+    return refresher.start()
+
+# Latest snapshot of the aggregate cube. When the survey can't be read the page stops with the reason; nothing
+# is cached then, so the next rerun tries again. Offline runs set SURVEY_DATA_SOURCE to the bundled sample.
+def current_cube():
+    try:
+        refresher = load_refresher()
+        return refresher.current if refresher is not None else METRICS.lookup("load_cube", load_cube)
+    except OSError as error:
+        if not is_url(url) and not os.path.exists(url):
+            st.error("Dataset not found.")
+        else:
+            st.error(f"Could not load the dataset: {error}. Set SURVEY_DATA_SOURCE=data/sample_survey.csv "
+                     "to run offline against the bundled sample.")
+        st.stop()
+
+# Per-year aggregates of SURVEY_YEARS, each year streamed once and cached under its source
+@st.cache_resource
+def load_survey_years():
+    with METRICS.timer("load", "load_survey_years"):
+        return load_years(chunk_rows=chunk_rows() or DEFAULT_CHUNK_ROWS, workers=worker_count())
+
+# Unfiltered aggregations written by 'python analytics.py', when SURVEY_PRECOMPUTED_DIR is set. They are skipped
+# when written with other SURVEY_AGE_BANDS, or the age chart would change bands once a filter is applied.
+@st.cache_resource
+def load_precomputed():
+    with METRICS.timer("load", "load_precomputed"):
+        directory = precomputed_dir()
+        if not directory:
+            return None
+        precomputed = PrecomputedAggregations(directory)
+        return precomputed if precomputed.current_age_bands() else None
+
+# Keeping rendered figures across reruns and sessions
+@st.cache_resource
+def load_figure_cache():
+    return FigureCache()
+
+# Optionally rendering the default word clouds in the background so the first visitor doesn't pay for them,
+# once per kind of source and dataset version (a refreshed snapshot, or the cube once a filter is applied)
+@st.cache_resource
+def prerender_wordclouds(_source, kind, version):
+    return start_prerender(_source, load_figure_cache())
+
+# Figure payload from the cache, timing ``build()`` and counting a miss when it has to run
+def cached_payload(source, name, filters, build):
+    built = []
+
+    def timed_build():
+        built.append(name)
+        with METRICS.timer("figure", name):
+            return build()
+
+    payload = load_figure_cache().get_or_build(figure_key(name, source.version, filters), timed_build)
+    METRICS.increment("cache_misses" if built else "cache_hits", f"figure:{name}")
+    return payload
+
+# Rendering a figure from the cache, drawing aggregation ``name`` with ``figure(data, filters)`` only on a miss
+# for this section, dataset version and filter state
+def cached_plotly(source, name, filters, figure):
+    def build():
+        return plotly_payload(figure(aggregate(source, name, filters), filters))
+
+    st.plotly_chart(pio.from_json(cached_payload(source, name, filters, build)))
+
+def cached_pyplot(source, name, filters, figure):
+    def build():
+        return png_payload(figure(aggregate(source, name, filters), filters))
+
+    st.image(cached_payload(source, name, filters, build))
+
+def cached_wordcloud(source, name, filters):
+    st.image(cached_payload(source, name, filters, lambda: render_wordcloud(source, name, filters)))
+
+# Sidebar Filters applied to every chart, remembered while visiting text sections
+def sidebar_filters(source):
+    st.sidebar.title("Filters")
+
+    saved = st.session_state.setdefault("filters", {})
+
+    # Keeping only the saved values still offered, as a refreshed snapshot may have dropped some
+    def multiselect(label, dimension):
+        options = source.options(dimension)
+        return st.sidebar.multiselect(label, options, default=[value for value in saved.get(dimension, [])
+                                                                 if value in options])
+
+    filters = {
+        "Country": multiselect("Country", "Country"),
+        "AgeBand": multiselect("Age band", "AgeBand"),
+        "EdLevel": multiselect("Education level", "EdLevel"),
+        "Gender": multiselect("Gender", "Gender"),
+    }
+    st.session_state["filters"] = filters
+
+    return filters
+
+# Loading the data and filters shared by the chart sections. The unfiltered view is served from
+# precomputed aggregations when available, so the dataset is only loaded once a filter is applied.
+def chart_context():
+    source = METRICS.lookup("load_precomputed", load_precomputed)
+    if source is None:
+        with st.spinner(text='Loading the dataset...'):
+            source = current_cube()
+
+    filters = sidebar_filters(source)
+    if any(filters.values()) and isinstance(source, PrecomputedAggregations):
+        with st.spinner(text='Loading the dataset...'):
+            source = current_cube()
+
+    if not isinstance(source, PrecomputedAggregations) and source.respondents(filters) == 0:
+        st.sidebar.warning("No respondents match the selected filters.")
+
+    prerender_wordclouds(source, type(source).__name__, source.version)
+    return source, filters
@@ -0,0 +1,80 @@
+import streamlit as st
+import pandas as pd
+from matplotlib.figure import Figure
+import seaborn as sns
+
+from analytics import aggregate
+from sections.common import cached_pyplot, cached_wordcloud
+
+
+# 1st Graph: Top 10 Languages Worked With (Bar Chart)
+def languages_figure(top_languages, filters):
+    fig1 = Figure()
+    ax = fig1.subplots()
+    sns.barplot(y=top_languages['tag'], x=top_languages['count'], ax=ax)
+    ax.set_title("Top 10 Languages Worked With")
+    ax.set_xlabel("Count")
+    ax.set_ylabel("Languages")
+    return fig1
+
+# 2nd Graph: Top 10 Databases Worked With (Bar Chart)
+def databases_figure(top_current_databases, filters):
+    fig2 = Figure()
+    ax = fig2.subplots()
+    sns.barplot(x=top_current_databases['count'], y=top_current_databases['tag'], ax=ax)
+    ax.set_title("Top 10 Databases Worked With")
+    ax.set_xlabel("Count")
+    ax.set_ylabel("Databases")
+    return fig2
+
+# 4th Graph: Top 10 Web Frameworks Worked With (Bubble Chart)
+def web_frameworks_figure(top_web_frameworks, filters):
+    bubble_data = pd.DataFrame({
+        'Framework': top_web_frameworks['tag'],
+        'Count': top_web_frameworks['count'],
+        'Size': top_web_frameworks['count']  # Size can be based on count
+    })
+    fig4 = Figure()
+    ax = fig4.subplots()
+    ax.scatter(bubble_data['Framework'], bubble_data['Count'], s=bubble_data['Size'] * 10, alpha=0.5)
+    ax.set_title("Top 10 Web Frameworks Worked With")
+    ax.set_xlabel("Web Frameworks")
+    ax.set_ylabel("Count")
+    ax.tick_params(axis='x', labelrotation=45)
+    return fig4
+
+# Figure builders of the section, keyed by the aggregation they draw; the word cloud lives in wordclouds.py
+FIGURES = {
+    'dashboard/languages': languages_figure,
+    'dashboard/databases': databases_figure,
+    'dashboard/web_frameworks': web_frameworks_figure,
+}
+
+
+def dashboard(source, filters):
+    st.title("Dashboard")
+
+    # Checking if the required columns are in the dataset
+    if 'LanguageWorkedWith' in source and 'DatabaseWorkedWith' in source and 'DatabaseDesireNextYear' in source and 'PlatformWorkedWith' in source and 'WebFrameWorkedWith' in source:
+        # Creating a 2x2 grid layout
+        col1, col2 = st.columns(2)
+        col3, col4 = st.columns(2)
+
+        with col1:
+            cached_pyplot(source, 'dashboard/languages', filters, languages_figure)
+
+        with col2:
+            cached_pyplot(source, 'dashboard/databases', filters, databases_figure)
+
+        # 3rd Graph: Platforms Worked With (Word Cloud)
+        with col3:
+            if aggregate(source, 'dashboard/platforms', filters).empty:
+                st.info("No platforms reported by the selected respondents.")
+            else:
+                cached_wordcloud(source, 'dashboard/platforms', filters)
+
+        with col4:
+            cached_pyplot(source, 'dashboard/web_frameworks', filters, web_frameworks_figure)
+
+    else:
+        st.error("Required columns 'LanguageWorkedWith', 'DatabaseWorkedWith', 'DatabaseDesireNextYear', 'PlatformWorkedWith', or 'WebFrameWorkedWith' not found in the dataset.")
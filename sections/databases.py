@@ -0,0 +1,36 @@
+import streamlit as st
+import plotly.express as px
+
+from sections.common import cached_plotly
+
+
+# Bar chart for top 10 databases currently used
+def current_databases_figure(top_current_databases, filters):
+    top_current_databases.columns = ['Database', 'Usage']
+
+    fig_current_db = px.bar(top_current_databases, x='Database', y='Usage', title="Top 10 Databases Currently Used", color='Usage',
+                            color_continuous_scale=px.colors.sequential.Viridis)
+    fig_current_db.update_yaxes(range=[0, 8000] if not any(filters.values()) else None)  # Set y-axis range from 0 to 8000 for the unfiltered survey
+    return fig_current_db
+
+# Bar chart for top 10 desired databases
+def future_databases_figure(top_future_databases, filters):
+    top_future_databases.columns = ['Database', 'Usage']
+
+    fig_future_db = px.bar(top_future_databases, x='Database', y='Usage', title="Top 10 Desired Databases", color='Usage',
+                            color_continuous_scale=px.colors.sequential.Plasma)
+    fig_future_db.update_yaxes(range=[0, 8000] if not any(filters.values()) else None)  # Set y-axis range from 0 to 8000 for the unfiltered survey
+    return fig_future_db
+
+# Figure builders of the section, keyed by the aggregation they draw
+FIGURES = {
+    'database_trends/current': current_databases_figure,
+    'database_trends/desired': future_databases_figure,
+}
+
+
+def database_trends(source, filters):
+    st.title("Database Trends")
+
+    cached_plotly(source, 'database_trends/current', filters, current_databases_figure)
+    cached_plotly(source, 'database_trends/desired', filters, future_databases_figure)
@@ -0,0 +1,43 @@
+import sys
+
+import streamlit as st
+
+from metrics import METRICS
+
+
+# Markdown table of ``rows`` under ``header``, so the panel needs neither pandas nor a dataframe widget
+def markdown_table(header, rows):
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    lines += ["| " + " | ".join(str(value) for value in row) + " |" for row in rows]
+    return "\n".join(lines)
+
+# Sidebar panel with the timings of this rerun (events after ``since``) and the cache counters of the process
+def debug_panel(since):
+    with st.sidebar.expander("⏱️ Performance", expanded=False):
+        events = METRICS.events(since)
+        st.markdown("**This rerun**")
+        st.markdown(markdown_table(["Step", "Name", "ms"],
+                                   [(kind, name, f"{seconds * 1000:.1f}") for kind, name, seconds in events])
+                    if events else "Nothing was timed.")
+
+        snapshot = METRICS.snapshot()
+        caches = {}
+        for row in snapshot["counters"]:
+            caches.setdefault(row["name"], {})[row["counter"]] = row["value"]
+        st.markdown("**Cache lookups**")
+        st.markdown(markdown_table(["Cache", "Hits", "Misses"],
+                                   [(name, counts.get("cache_hits", 0), counts.get("cache_misses", 0))
+                                    for name, counts in sorted(caches.items())]))
+
+        # The figure cache only exists once a chart section was rendered in this process
+        common = sys.modules.get("sections.common")
+        if common is not None:
+            figures = common.load_figure_cache()
+            st.caption(f"Figure cache: {len(figures)} figures, {figures.nbytes / 2**20:.1f} MiB, "
+                       f"{figures.hits} hits, {figures.misses} misses")
+
+        st.markdown("**Since start**")
+        st.markdown(markdown_table(["Step", "Name", "Runs", "Mean ms", "Max ms"],
+                                   [(row["kind"], row["name"], row["count"],
+                                     f"{row['seconds_total'] / row['count'] * 1000:.1f}", f"{row['seconds_max'] * 1000:.1f}")
+                                    for row in sorted(snapshot["timings"], key=lambda row: (row["kind"], row["name"]))]))
@@ -0,0 +1,63 @@
+import streamlit as st
+import plotly.express as px
+
+from sections.common import cached_plotly
+
+
+# 1st Graph: Gender Breakdown (Pie Chart)
+def gender_figure(gender_count, filters):
+    return px.pie(names=gender_count['Gender'], values=gender_count['count'], title="Gender Breakdown")
+
+# 2nd Graph: Respondent Count by Country (Choropleth Map), keyed by the ISO-3 codes resolved at load
+def country_figure(country_count, filters):
+    return px.choropleth(locationmode="ISO-3", locations=country_count['CountryCode'],
+                         color=country_count['count'], hover_name=country_count['Country'],
+                         title="Respondent Count by Country", color_continuous_scale=px.colors.sequential.Plasma)
+
+# 3rd Graph: Respondent Count by Age Band (Line Plot), binned server-side (SURVEY_AGE_BANDS)
+def age_figure(age_count, filters):
+    return px.line(x=age_count['AgeBand'].astype(str), y=age_count['count'], title="Respondent Count by Age",
+                   labels={'x': 'Age', 'y': 'Count'}, markers=True)
+
+# 4th Graph: Respondent Count by Education Level (Bar Chart)
+def education_figure(combined_count, filters):
+    combined_count = combined_count.rename(columns={'count': 'Count'})
+    fig4 = px.bar(combined_count, x='EdLevel', y='Count', color='Gender',
+                  title="Respondent Count by Gender and Education Level", barmode='group')
+
+    # Updating layout for better readability
+    fig4.update_layout(xaxis_title="Education Level", yaxis_title="Count", xaxis_tickangle=-45,
+        # Rotate x-axis labels
+        height=600,  # Increase height for better spacing
+        font=dict(size=12),  # Increase font size
+        legend_title_text='Gender',  # Legend title
+        hovermode="x unified"  # Unified hover mode
+    )
+    return fig4
+
+# Figure builders of the section, keyed by the aggregation they draw
+FIGURES = {
+    'demographics/gender': gender_figure,
+    'demographics/country': country_figure,
+    'demographics/age': age_figure,
+    'demographics/education': education_figure,
+}
+
+
+def demographics(source, filters):
+    st.title("Demographics")
+
+    if 'Gender' in source:
+        cached_plotly(source, 'demographics/gender', filters, gender_figure)
+
+    if 'Country' in source:
+        cached_plotly(source, 'demographics/country', filters, country_figure)
+
+    if 'Age' in source:
+        try:
+            cached_plotly(source, 'demographics/age', filters, age_figure)
+        except ValueError as error:  # SURVEY_AGE_BANDS is not a list of ages
+            st.error(f"Could not draw the age chart: {error}")
+
+    if 'EdLevel' in source:
+        cached_plotly(source, 'demographics/education', filters, education_figure)
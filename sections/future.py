@@ -0,0 +1,79 @@
+import streamlit as st
+import pandas as pd
+from matplotlib.figure import Figure
+import seaborn as sns
+
+from analytics import aggregate
+from sections.common import cached_pyplot, cached_wordcloud
+
+
+# 1st Graph: Top 10 Desired Languages (Bar Chart)
+def languages_figure(top_desired_languages, filters):
+    fig1 = Figure()
+    ax = fig1.subplots()
+    sns.barplot(y=top_desired_languages['tag'], x=top_desired_languages['count'], ax=ax)
+    ax.set_title("Top 10 Desired Languages")
+    ax.set_xlabel("Count")
+    ax.set_ylabel("Languages")
+    return fig1
+
+# 2nd Graph: Top 10 Desired Databases (Bar Chart)
+def databases_figure(top_desired_databases, filters):
+    fig2 = Figure()
+    ax = fig2.subplots()
+    sns.barplot(x=top_desired_databases['count'], y=top_desired_databases['tag'], ax=ax)
+    ax.set_title("Top 10 Desired Databases")
+    ax.set_xlabel("Count")
+    ax.set_ylabel("Databases")
+    return fig2
+
+# 4th Graph: Top 10 Desired Web Frameworks (Bubble Chart)
+def web_frameworks_figure(top_desired_web_frameworks, filters):
+    bubble_data = pd.DataFrame(
+        {'Framework': top_desired_web_frameworks['tag'], 'Count': top_desired_web_frameworks['count'],
+            'Size': top_desired_web_frameworks['count']  # Size can be based on count
+        })
+    fig4 = Figure()
+    ax = fig4.subplots()
+    ax.scatter(bubble_data['Framework'], bubble_data['Count'], s=bubble_data['Size'] * 10, alpha=0.5)
+    ax.set_title("Top 10 Desired Web Frameworks")
+    ax.set_xlabel("Web Frameworks")
+    ax.set_ylabel("Count")
+    ax.tick_params(axis='x', labelrotation=45)
+    return fig4
+
+# Figure builders of the section, keyed by the aggregation they draw; the word cloud lives in wordclouds.py
+FIGURES = {
+    'future_technology_trends/languages': languages_figure,
+    'future_technology_trends/databases': databases_figure,
+    'future_technology_trends/web_frameworks': web_frameworks_figure,
+}
+
+
+def future_technology_trends(source, filters):
+    st.title("Future Technology Trends")
+
+    # Checking if the required columns are in the dataset
+    if 'LanguageDesireNextYear' in source and 'DatabaseDesireNextYear' in source and 'PlatformDesireNextYear' in source and 'WebFrameDesireNextYear' in source:
+        # Creating a 2x2 grid layout
+        col1, col2 = st.columns(2)
+        col3, col4 = st.columns(2)
+
+        with col1:
+            cached_pyplot(source, 'future_technology_trends/languages', filters, languages_figure)
+
+        with col2:
+            cached_pyplot(source, 'future_technology_trends/databases', filters, databases_figure)
+
+        # 3rd Graph: Desired Platforms (Word Cloud)
+        with col3:
+            if aggregate(source, 'future_technology_trends/platforms', filters).empty:
+                st.info("No platforms reported by the selected respondents.")
+            else:
+                cached_wordcloud(source, 'future_technology_trends/platforms', filters)
+
+        with col4:
+            cached_pyplot(source, 'future_technology_trends/web_frameworks', filters, web_frameworks_figure)
+
+    else:
+        st.error("Required columns 'LanguageDesireNextYear', 'DatabaseDesireNextYear', 'PlatformDesireNextYear', or 'WebFrameworkDesireNextYear' not found in the dataset.")
@@ -0,0 +1,36 @@
+import streamlit as st
+import plotly.express as px
+
+from sections.common import cached_plotly
+
+
+# Creating a bar chart for Top 10 Languages Currently Used
+def current_languages_figure(top_current_languages, filters):
+    top_current_languages.columns = ['Language', 'Usage']
+
+    fig1 = px.bar(top_current_languages, x='Language', y='Usage', title="Top 10 Languages Currently Used", color='Usage',
+                  color_continuous_scale=px.colors.sequential.Viridis)
+    fig1.update_yaxes(range=[0, 8000] if not any(filters.values()) else None)  # Set y-axis range from 0 to 8000 for the unfiltered survey
+    return fig1
+
+# Creating a bar chart for Top 10 Desired Languages
+def future_languages_figure(top_future_languages, filters):
+    top_future_languages.columns = ['Language', 'Usage']
+
+    fig2 = px.bar(top_future_languages, x='Language', y='Usage', title="Top 10 Desired Languages", color='Usage',
+                  color_continuous_scale=px.colors.sequential.Plasma)
+    fig2.update_yaxes(range=[0, 8000] if not any(filters.values()) else None)  # Set y-axis range from 0 to 8000 for the unfiltered survey
+    return fig2
+
+# Figure builders of the section, keyed by the aggregation they draw
+FIGURES = {
+    'language_trends/current': current_languages_figure,
+    'language_trends/desired': future_languages_figure,
+}
+
+
+def language_trends(source, filters):
+    st.title("Programming Language Trends")
+
+    cached_plotly(source, 'language_trends/current', filters, current_languages_figure)
+    cached_plotly(source, 'language_trends/desired', filters, future_languages_figure)
@@ -0,0 +1,191 @@
+import streamlit as st
+
+
+# Sections
+def executive_summary():
+    st.title("Executive Summary")
+    st.title("Programming Languages and Technologies in Demand")
+
+# Adding a section for programming languages
+    st.header("Top Programming Languages in Demand")
+    programming_languages = ["JavaScript", "HTML/CSS", "SQL", "Bash/Shell/PowerShell", "Python"]
+    st.markdown("• " + "\n• ".join(programming_languages))
+
+# Adding a section for database skills
+    st.header("Top Database Skills in Demand")
+    database_skills = ["MySQL", "Microsoft SQL Server", "PostgreSQL", "SQLite", "MongoDB"]
+    st.markdown("• " + "\n• ".join(database_skills))
+
+# Adding a section for popular platforms
+    st.header("Popular Platforms")
+    popular_platforms = ["Windows", "Linux", "Docker", "AWS", "Slack"]
+    st.markdown("• " + "\n• ".join(popular_platforms))
+
+# Adding a section for popular web frameworks
+    st.header("Popular Web Frameworks")
+    web_frameworks = ["jQuery", "Angular/Angular.js", "React.js", "ASP.NET", "Express"]
+    st.markdown("• " + "\n• ".join(web_frameworks))
+
+# Adding a section for future technology trends
+    st.header("Future Technology Trends")
+    future_trends = ["Python takes the third row, followed by SQL and TypeScript",
+    "Redis and Elasticsearch also place in Top 5", "Android is in the Top 5 demanded platforms, the rest remains",
+    "React.js takes the first row and Vue.js is the latest addition as the last"]
+    st.markdown("• " + "\n• ".join(future_trends))
+
+
+def introduction():
+    st.title("Introduction")
+
+
+    st.markdown("""
+    In the realm of programming and technology, several key trends have emerged in recent years. 
+    These insights shed light on the evolving landscape of programming languages, web frameworks, and the demographics of professional developers.
+
+    **Key Highlights:**
+    - **Inclusive Survey**: Stack Overflow conducts an inclusive survey of individuals engaged in coding globally.
+    - **Wide Array of Topics**: The survey covers a wide array of topics from preferred technologies to career aspirations.
+    - **9th Consecutive Year**: 2019 marks the 9th consecutive year of survey publication.
+    - **High Participation**: Nearly **90,000 developers** participated in the 20-minute survey in 2019.
+
+    Let's explore some of the notable findings!
+    """)
+
+def methodology():
+    st.title("Methodology")
+
+    # Introduction
+    st.markdown("""
+    The data presented in this analysis is based on a survey conducted by **Stack Overflow** from **January 23 to February 14**, involving **88,883 software developers** from **179 countries**.
+    """)
+
+
+    st.header("Key Steps in the Methodology")
+    st.markdown("""
+    - **Familiarization with the Dataset**: 
+        - Completed IBM labs on Coursera, covering topics such as:
+            - Web Scraping
+            - Dataset Exploration
+            - Data Wrangling
+            - Exploratory Data Analysis
+            - Data Visualization
+
+    - **Data Analysis and Visualization**: 
+        - Conducted using **Python** and its powerful libraries.
+    """)
+
+
+def results():
+    st.title("Results")
+
+    st.markdown("""
+    Here are some key findings from the survey:
+
+    - **Python** has overtaken Java, becoming the **5th most preferred language** with significant growth. It stands as the **fastest-growing major programming language**.
+    - **JavaScript** remains the **most used programming language**.
+    - **jQuery** is the most widely used among web frameworks, with **React.js** surpassing **Angular** in developer usage this year.
+    - Globally, **men represent approximately 90%** of respondents, with higher female representation among students than professional developers in regions like the **US**, **India**, and the **UK**.
+    - Around **3/4 of professional developers** globally hold at least a **bachelor's degree**, aligning with past findings.
+    - **3/4 of survey respondents** in professional developer roles are under **35 years old**.
+    """)
+
+
+def findings_and_implications():
+    st.title("Findings and Implications")
+
+    # Creating two columns for side-by-side layout
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.header("Findings")
+        st.markdown("""
+        - **JavaScript** and **HTML/CSS** emerge as the most used programming languages among all respondents.
+        - **SQL** also maintains a significant presence.
+        - **Python** just edged out **Java** in overall ranking.
+        - The dominance of JavaScript and HTML/CSS underscores their indispensability in modern web development, highlighting the importance of mastering them for developers.
+        - The high usage of SQL emphasizes the critical role of data management and querying in modern software applications, across both web and non-web environments.
+        - The rise of Python might also reflect its versatility and ease of use, attracting developers across various domains from data science to software development.
+        """)
+
+
+    with col2:
+        st.header("Implications")
+        st.markdown("""
+        - Developers should prioritize mastering **JavaScript** and **HTML/CSS** to remain competitive in the job market.
+        - Understanding **SQL** is essential for anyone involved in data management, as it is a critical skill across various applications.
+        - The growing popularity of **Python** suggests that learning this language can open up opportunities in diverse fields, including data science, machine learning, and web development.
+        - Organizations should consider investing in training programs for their developers to enhance skills in these key areas, ensuring they stay relevant in a rapidly evolving tech landscape.
+        - As the demand for web applications continues to rise, proficiency in modern web technologies will be crucial for developers aiming to create effective and efficient solutions.
+        """)
+
+
+def database_findings_and_implications():
+    st.title("Database Findings and Implications")
+
+    # Creating two columns for side-by-side layout
+    col1, col2 = st.columns(2)
+
+
+    with col1:
+        st.header("Findings")
+        st.markdown("""
+        - **MySQL** remains the most widely used database management system (DBMS), indicating its strong foothold in the industry.
+        - **PostgreSQL** and **Microsoft SQL Server** are also highly favored, showcasing the continued reliance on relational databases for structured data management.
+        - **MongoDB** has established itself as the leading NoSQL database, reflecting a shift towards flexible data models that accommodate unstructured data.
+        - The presence of **Redis** and **Elasticsearch** highlights the growing importance of in-memory data stores and search engines in modern applications.
+        - The future trends indicate a potential rise in the usage of **PostgreSQL** and **MongoDB**, suggesting that developers are increasingly recognizing the value of these databases for both relational and NoSQL needs.
+        - The diverse range of databases utilized by developers emphasizes the necessity of selecting the right tool based on specific project requirements, including data structure, scalability, and performance.
+        """)
+
+
+    with col2:
+        st.header("Implications")
+        st.markdown("""
+        - Organizations should invest in training and resources for **MySQL**, **PostgreSQL**, and **Microsoft SQL Server** to maximize the benefits of relational databases in their operations.
+        - The growing popularity of **MongoDB** indicates that developers should enhance their skills in NoSQL databases to effectively handle modern data challenges.
+        - It is crucial for developers to evaluate project requirements carefully, including data structure and scalability, to select the most appropriate database system for their applications.
+        - As data complexity increases, understanding the distinctions between relational and NoSQL databases will be vital for effective data management and application performance.
+        - Companies should adopt a hybrid database strategy, leveraging both relational and NoSQL databases to create a robust data architecture that meets diverse application needs and enhances overall performance.
+        """)
+
+
+def concluding_remarks():
+    st.title("Concluding Remarks")
+
+    st.markdown("""
+    ### Key Insights
+
+    - **Technology Trends**: 
+      The dominance of JavaScript and HTML/CSS emphasizes the necessity for developers to stay updated with the latest trends in web development. These technologies are foundational for creating dynamic and interactive web applications.
+
+    - **Data Management**: 
+      The prevalence of MySQL, PostgreSQL, and Microsoft SQL Server highlights the critical importance of effective data management in software development. Choosing the right database system is essential for ensuring data integrity and accessibility.
+
+    - **Diversity of Tools**: 
+      The wide array of programming languages and database systems utilized by developers underscores the importance of understanding the strengths and weaknesses of different tools. This knowledge enables developers to select the most appropriate technologies for their specific projects.
+
+    - **Web Dominance**: 
+      The widespread usage of JavaScript and HTML/CSS indicates the dominance of web development within the programming ecosystem. This trend reflects the growing importance of online platforms and digital experiences in today’s technology landscape.
+
+    - **Database Diversity**: 
+      The variety of database management systems in use highlights the need for flexibility and adaptability in data storage solutions. Organizations must consider factors such as data structure, scalability, and performance when selecting a database system to meet their needs.
+
+    - **Industry Standardization**: 
+      The popularity of certain technologies, such as JavaScript and MySQL, suggests a degree of industry standardization. These tools have become widely adopted due to their proven reliability and effectiveness, simplifying collaboration and interoperability within the developer community.
+    """)
+
+
+
+def conclusion():
+    st.title("Conclusion")
+
+    st.markdown("""
+    ### Key Takeaways
+
+    - The findings underscore the dynamic nature of the programming landscape and the critical role of technology in driving innovation across industries.
+
+    - As developers navigate this ever-changing terrain, it is essential to have:
+        - A keen understanding of diverse programming languages.
+        - Proficiency in various database systems to meet the demands of modern applications.
+        - The ability to ensure optimal outcomes in software development projects.
+    """)
@@ -0,0 +1,57 @@
+import streamlit as st
+import plotly.express as px
+
+from analytics import input_columns
+from metrics import METRICS
+from sections.common import cached_plotly, load_survey_years
+from years import YEARS_ENV
+
+
+# Line chart of the share of respondents using each tag per survey year
+def trend_figure(trends, title, label):
+    fig = px.line(trends, x='Year', y='share', color='tag', markers=True, title=title,
+                  labels={'share': 'Share of Respondents', 'tag': label})
+    fig.update_xaxes(dtick=1)  # One tick per survey year
+    fig.update_yaxes(tickformat='.0%')
+    return fig
+
+def languages_figure(trends, filters):
+    return trend_figure(trends, "Top 10 Languages Year over Year", 'Language')
+
+def databases_figure(trends, filters):
+    return trend_figure(trends, "Top 10 Databases Year over Year", 'Database')
+
+def platforms_figure(trends, filters):
+    return trend_figure(trends, "Top 10 Platforms Year over Year", 'Platform')
+
+def web_frameworks_figure(trends, filters):
+    return trend_figure(trends, "Top 10 Web Frameworks Year over Year", 'Web Framework')
+
+# Figure builders of the section, keyed by the aggregation they draw
+FIGURES = {
+    'year_over_year/languages': languages_figure,
+    'year_over_year/databases': databases_figure,
+    'year_over_year/platforms': platforms_figure,
+    'year_over_year/web_frameworks': web_frameworks_figure,
+}
+
+
+def year_over_year(source, filters):
+    st.title("Year-over-Year Trends")
+
+    try:
+        years = METRICS.lookup("load_survey_years", load_survey_years)
+    except (OSError, ValueError) as error:
+        st.error(f"Could not load the survey years: {error}")
+        return
+
+    if len(years) < 2:
+        st.info(f"Set {YEARS_ENV} to two or more yearly survey files, e.g. "
+                f"`{YEARS_ENV}=2019=m1_survey_data.csv,2020=survey_2020.csv`, to compare technology usage across years.")
+        return
+
+    st.write(f"Share of respondents who worked with each technology, {min(years.cubes)} to {max(years.cubes)}. "
+             "The top 10 of the latest year are shown.")
+    for name, figure in FIGURES.items():
+        if all(column in years for column in input_columns(name)):
+            cached_plotly(years, name, filters, figure)
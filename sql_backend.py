@@ -0,0 +1,231 @@
+"""SQLite execution backend for the chart aggregations.
+
+The survey is normalized into an embedded database: one ``respondent`` row
+per respondent with its demographics, a ``tag`` vocabulary per multi-select
+column and a ``respondent_tag`` link table holding one row per selected tag.
+``SqlSurvey`` answers the same top-N and group-by queries as
+``AggregateCube`` with indexed SQL, so ``analytics`` can run on either:
+
+    SURVEY_BACKEND=sqlite streamlit run data-analytics-capstone.py
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cube import AGE_BINS, AGE_LABELS, DIMENSIONS, age_bands, band_counts
+from dataset import cache_dir, cache_key, temporary_path
+from geo import country_codes
+from tag_index import build_tag_indexes
+
+
+# Aggregation backend: "cube" (in-memory aggregate cube, the default) or "sqlite"
+BACKEND_ENV = "SURVEY_BACKEND"
+BACKENDS = ("cube", "sqlite")
+
+SCHEMA_SQL = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE respondent (
+    id INTEGER PRIMARY KEY,
+    Country TEXT, CountryCode TEXT, AgeBand TEXT, EdLevel TEXT, Gender TEXT, Age REAL
+);
+CREATE TABLE tag (id INTEGER PRIMARY KEY, survey_column TEXT NOT NULL, tag TEXT NOT NULL,
+                  UNIQUE (survey_column, tag));
+CREATE TABLE respondent_tag (
+    tag_id INTEGER NOT NULL REFERENCES tag (id),
+    respondent_id INTEGER NOT NULL REFERENCES respondent (id),
+    PRIMARY KEY (tag_id, respondent_id)
+) WITHOUT ROWID;
+"""
+
+INDEX_SQL = """
+CREATE INDEX respondent_country ON respondent (Country);
+CREATE INDEX respondent_age_band ON respondent (AgeBand);
+CREATE INDEX respondent_ed_level ON respondent (EdLevel);
+CREATE INDEX respondent_gender ON respondent (Gender);
+CREATE INDEX respondent_tag_respondent ON respondent_tag (respondent_id, tag_id);
+"""
+
+# Respondent columns the group-by queries may name; column names can't be bound as parameters
+GROUP_COLUMNS = set(DIMENSIONS) | {"CountryCode"}
+
+
+def backend():
+    value = os.environ.get(BACKEND_ENV, "cube").strip().lower() or "cube"
+    if value not in BACKENDS:
+        raise ValueError(f"{BACKEND_ENV} must be one of {', '.join(BACKENDS)}, got {value!r}")
+    return value
+
+
+def database_path(source, directory=None):
+    directory = Path(directory) if directory is not None else cache_dir()
+    return directory / f"survey-{cache_key(source)}.sqlite"
+
+
+def _nullable(values):
+    """Column values as Python objects with missing values as None, ready for sqlite3."""
+    values = pd.Series(values).astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def write_database(df, path, tag_indexes=None):
+    """Normalize the survey ``df`` into a new SQLite database at ``path``."""
+    tag_indexes = build_tag_indexes(df) if tag_indexes is None else tag_indexes
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Building into a temporary file of this writer first so readers never open a partial database
+    tmp_path = temporary_path(path)
+    tmp_path.unlink(missing_ok=True)
+
+    def column(name):
+        return df[name] if name in df.columns else pd.Series(np.nan, index=df.index)
+
+    age = column("Age").astype("float64")
+    respondents = zip(range(len(df)), _nullable(column("Country")), _nullable(country_codes(column("Country"))),
+                      _nullable(age_bands(age)), _nullable(column("EdLevel")), _nullable(column("Gender")),
+                      _nullable(age))
+
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.executescript(SCHEMA_SQL)
+        connection.executemany("INSERT INTO respondent VALUES (?, ?, ?, ?, ?, ?, ?)", respondents)
+
+        tag_id = 0
+        for survey_column, index in tag_indexes.items():
+            for code, tag in enumerate(index.vocabulary):
+                connection.execute("INSERT INTO tag VALUES (?, ?, ?)", (tag_id, survey_column, tag))
+                connection.executemany("INSERT INTO respondent_tag VALUES (?, ?)",
+                                       ((tag_id, int(row)) for row in index.rows(code)))
+                tag_id += 1
+
+        columns = [name for name in df.columns if name in DIMENSIONS + ["Age"] or name in tag_indexes]
+        connection.executemany("INSERT INTO meta VALUES (?, ?)",
+                               [("version", df.attrs.get("version") or ""), ("columns", ",".join(columns))])
+        connection.executescript(INDEX_SQL)
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+class SqlSurvey:
+    """The survey in a SQLite database, queried with the interface of ``AggregateCube``.
+
+    A single read-only connection is shared by all sessions and guarded by a lock.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        meta = dict(self._query("SELECT key, value FROM meta"))
+        self.version = meta.get("version") or None
+        self.columns = [name for name in meta.get("columns", "").split(",") if name]
+
+    @classmethod
+    def build(cls, df, path, tag_indexes=None):
+        return cls(write_database(df, path, tag_indexes))
+
+    def _query(self, sql, parameters=()):
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def close(self):
+        """Close the connection, releasing the database file once it was replaced by a newer one."""
+        with self._lock:
+            self._connection.close()
+
+    def __del__(self):
+        # Closing as soon as no session or thread holds this snapshot any more; left to itself the
+        # connection is only closed once the cycle collector runs
+        if hasattr(self, "_connection"):
+            self._connection.close()
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def _where(self, filters, alias="r"):
+        """SQL conditions and parameters selecting the respondents matching ``filters``."""
+        conditions, parameters = [], []
+        for dimension, values in (filters or {}).items():
+            if values:
+                if dimension not in DIMENSIONS:
+                    raise ValueError(f"Unknown filter dimension {dimension!r}")
+                conditions.append(f"{alias}.{dimension} IN ({', '.join('?' * len(values))})")
+                parameters.extend(values)
+        return conditions, parameters
+
+    def options(self, dimension):
+        """Values a filter on ``dimension`` can take, in display order."""
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension {dimension!r}")
+        values = [value for (value,) in self._query(
+            f"SELECT DISTINCT {dimension} FROM respondent WHERE {dimension} IS NOT NULL ORDER BY {dimension}")]
+        if dimension == "AgeBand":
+            return [label for label in AGE_LABELS if label in values]
+        return values
+
+    def respondents(self, filters=None):
+        conditions, parameters = self._where(filters)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(f"SELECT COUNT(*) FROM respondent r {where}", parameters)[0][0]
+
+    def tag_counts(self, column, filters=None):
+        """Respondents per tag of ``column`` within the filtered respondents, most common first."""
+        conditions, parameters = self._where(filters)
+        join = "JOIN respondent r ON r.id = rt.respondent_id" if conditions else ""
+        vocabulary = [tag for (tag,) in self._query("SELECT tag FROM tag WHERE survey_column = ? ORDER BY tag",
+                                                    [column])]
+        rows = dict(self._query(
+            f"SELECT t.tag, COUNT(*) FROM respondent_tag rt JOIN tag t ON t.id = rt.tag_id {join} "
+            f"WHERE {' AND '.join(['t.survey_column = ?', *conditions])} GROUP BY t.tag",
+            [column, *parameters]))
+        # Same vocabulary order and stable sort as the cube, so ties rank identically
+        counts = pd.Series([rows.get(tag, 0) for tag in vocabulary], index=pd.Index(vocabulary, name="tag"),
+                           dtype="int64", name="count")
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def top(self, column, n=10, filters=None):
+        return self.tag_counts(column, filters).head(n)
+
+    def respondent_counts(self, by, filters=None):
+        """Respondents grouped by one or more dimensions, missing values excluded."""
+        by = [by] if isinstance(by, str) else list(by)
+        if not set(by) <= GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {by!r}")
+        conditions, parameters = self._where(filters)
+        conditions += [f"r.{name} IS NOT NULL" for name in by]
+        columns = ", ".join(f"r.{name}" for name in by)
+        rows = self._query(f"SELECT {columns}, COUNT(*) FROM respondent r WHERE {' AND '.join(conditions)} "
+                           f"GROUP BY {columns} ORDER BY {columns}", parameters)
+        index = (pd.Index([row[0] for row in rows], name=by[0]) if len(by) == 1
+                 else pd.MultiIndex.from_tuples([row[:-1] for row in rows], names=by))
+        return pd.Series([row[-1] for row in rows], index=index, dtype="int64", name="respondents")
+
+    def age_counts(self, filters=None):
+        """Respondents per exact age within the filtered respondents, sorted by age."""
+        conditions, parameters = self._where(filters)
+        conditions.append("r.Age IS NOT NULL")
+        rows = self._query(f"SELECT r.Age, COUNT(*) FROM respondent r WHERE {' AND '.join(conditions)} "
+                           "GROUP BY r.Age ORDER BY r.Age", parameters)
+        return pd.Series([count for _, count in rows], index=pd.Index([age for age, _ in rows], name="Age"),
+                         dtype="int64", name="respondents")
+
+    def age_band_counts(self, edges=AGE_BINS, filters=None):
+        return band_counts(self.age_counts(filters), edges)
+
+
+def load_sql_survey(df, directory=None):
+    """SQLite backend of the survey ``df``, reusing the database built for the same dataset version."""
+    path = database_path(df.attrs.get("source", ""), directory)
+    if path.exists():
+        survey = SqlSurvey(path)
+        if survey.version == df.attrs.get("version"):
+            return survey
+        survey.close()
+    return SqlSurvey.build(df, path)
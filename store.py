@@ -0,0 +1,77 @@
+"""Aggregate store shared by every app process on one (possibly network) disk.
+
+With several Streamlit replicas pointed at the same SURVEY_SHARED_DIR, the
+first one to start takes a file lock, downloads and aggregates the survey and
+writes the cube as checksummed Arrow files; the others wait on the lock and
+then only memory-map the finished cube. No replica but the builder ever holds
+the respondent table, so memory and warm-up cost don't grow with the number
+of replicas.
+"""
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from cube import AggregateCube
+from dataset import cache_key, ingest, load_dataset, read_manifest, source_changed, source_fingerprint
+from streaming import aggregates_dir, ingest_aggregates, read_aggregates_manifest, write_aggregates
+from tag_index import build_tag_indexes
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, replicas may build concurrently
+    fcntl = None
+
+
+# Directory on disk shared by all app processes that holds the survey aggregates
+SHARED_DIR_ENV = "SURVEY_SHARED_DIR"
+
+
+def shared_dir():
+    return os.environ.get(SHARED_DIR_ENV) or None
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive advisory lock on ``path`` held for the duration of the block."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def lock_path(source, directory):
+    return Path(directory) / f"aggregates-{cache_key(source)}.lock"
+
+
+def build_aggregates(source, directory, chunk_rows=None, workers=1):
+    """Aggregate ``source`` and write its cube to ``directory``, streaming it when ``chunk_rows`` is set."""
+    if chunk_rows:
+        return ingest_aggregates(source, directory, chunk_rows, workers)
+    fingerprint = source_fingerprint(source)
+    dataset = read_manifest(source, directory)
+    if dataset is None or source_changed(source, dataset):
+        ingest(source, directory)
+    df = load_dataset(source, directory)
+    cube = AggregateCube.build(df, build_tag_indexes(df, workers=workers))
+    return write_aggregates(source, cube, directory, fingerprint=fingerprint, rows=len(df))
+
+
+def load_shared_cube(source, directory, chunk_rows=None, workers=1):
+    """Cube of ``source`` from the shared store, built by whichever process gets the lock first.
+
+    A stored cube is rebuilt when the source changed since it was built; this is
+    checked under the lock, so of several processes noticing the same change
+    only the first rebuilds.
+    """
+    with file_lock(lock_path(source, directory)):
+        manifest = read_aggregates_manifest(source, directory)
+        if manifest is None or source_changed(source, manifest):
+            manifest = build_aggregates(source, directory, chunk_rows, workers)
+        # Still under the lock, so a concurrent rebuild never swaps the files mid-read
+        return AggregateCube.load(aggregates_dir(source, directory), version=manifest["version"])
@@ -0,0 +1,183 @@
+"""Chunked ingestion of surveys too large to load into memory.
+
+The CSV is read ``chunk_rows`` respondents at a time; each chunk is reduced
+to an ``AggregateCube`` and folded into the running cube, so peak memory
+depends on the chunk size and the number of demographic cells, never on the
+number of respondents. Only the aggregates are persisted:
+
+    python streaming.py m1_survey_data.csv --chunk-rows 200000
+"""
+import argparse
+import errno
+import glob
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from cube import AggregateCube
+from dataset import cache_dir, cache_key, data_source, file_checksum, read_survey_csv, source_changed, source_fingerprint
+from parallel import ordered_map, worker_count
+from tag_index import build_tag_indexes
+
+
+# Set to a row count to stream the survey in chunks and keep only its aggregates
+CHUNK_ROWS_ENV = "SURVEY_CHUNK_ROWS"
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+def chunk_rows():
+    """Chunk size configured through SURVEY_CHUNK_ROWS, or None when streaming is off."""
+    value = os.environ.get(CHUNK_ROWS_ENV, "")
+    return int(value) if value.strip() else None
+
+
+def aggregates_dir(source, directory=None):
+    directory = Path(directory) if directory is not None else cache_dir()
+    return directory / f"aggregates-{cache_key(source)}"
+
+
+def chunk_cube(chunk):
+    """Cube of one chunk of respondents and its row count."""
+    return AggregateCube.build(chunk, build_tag_indexes(chunk)), len(chunk)
+
+
+def stream_cube(source, chunk_rows=DEFAULT_CHUNK_ROWS, workers=1):
+    """Cube of the whole survey built chunk by chunk, with the number of respondents and chunks read.
+
+    With ``workers > 1`` chunks are aggregated in parallel worker processes and
+    merged in file order, so the result does not depend on the worker count.
+    """
+    cube, rows, chunks = None, 0, 0
+    for partial, n in ordered_map(chunk_cube, read_survey_csv(source, chunksize=chunk_rows), workers):
+        cube = partial if cube is None else AggregateCube.merge([cube, partial])
+        rows += n
+        chunks += 1
+    if cube is None:
+        cube = AggregateCube.build(pd.DataFrame(), {})
+    return cube, rows, chunks
+
+
+def replace_dir(tmp, target):
+    """Move the directory ``tmp`` to ``target``, replacing the current one.
+
+    The current directory is renamed aside and only deleted afterwards, so
+    ``target`` is missing for the instant between two renames rather than for
+    a whole delete. When a concurrent writer moves its own directory in first,
+    that one is set aside in turn and the last writer wins.
+    """
+    aside = Path(tempfile.mkdtemp(dir=target.parent, prefix=target.name + ".", suffix=".old"))
+    try:
+        for attempt in itertools.count():
+            try:
+                os.rename(target, aside / str(attempt))
+            except FileNotFoundError:
+                pass
+            try:
+                os.rename(tmp, target)
+                return
+            except OSError as error:
+                if error.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+    finally:
+        shutil.rmtree(aside, ignore_errors=True)
+
+
+def write_aggregates(source, cube, directory=None, **details):
+    """Store ``cube`` as the aggregates of ``source`` with a checksum manifest holding ``details``."""
+    target = aggregates_dir(source, directory)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    # Writing to a temporary directory of this writer first so readers never see a partial cube
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=target.name + ".", suffix=".tmp"))
+    try:
+        files = {name: file_checksum(tmp / name) for name in cube.save(tmp)}
+        version = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        manifest = {"source": source, "version": version, **details, "files": files}
+        (tmp / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        replace_dir(tmp, target)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return manifest
+
+
+def ingest_aggregates(source, directory=None, chunk_rows=DEFAULT_CHUNK_ROWS, workers=1):
+    """Stream ``source`` into a cube and store it with a checksum manifest, without keeping any respondent rows."""
+    fingerprint = source_fingerprint(source)
+    cube, rows, chunks = stream_cube(source, chunk_rows, workers)
+    return write_aggregates(source, cube, directory, fingerprint=fingerprint, rows=rows, chunks=chunks,
+                            chunk_rows=chunk_rows)
+
+
+def verified(target, manifest):
+    """Whether every file listed in ``manifest`` is in ``target`` with its recorded checksum."""
+    try:
+        return all(file_checksum(target / name) == checksum for name, checksum in manifest.get("files", {}).items())
+    except OSError:
+        return False
+
+
+def directory_id(path):
+    try:
+        return path.stat().st_ino
+    except OSError:
+        return None
+
+
+def swapping(target):
+    """Whether a writer is between the two renames of ``replace_dir`` on ``target``."""
+    return any(target.parent.glob(glob.escape(target.name) + ".*.old"))
+
+
+def read_aggregates_manifest(source, directory=None, attempts=10):
+    """Manifest of the stored aggregates of ``source`` once their checksums match, or None.
+
+    A cube replaced by a concurrent writer while being checked is read again
+    rather than reported missing, which would start another ingest.
+    """
+    target = aggregates_dir(source, directory)
+    for _ in range(attempts):
+        before = directory_id(target)
+        try:
+            manifest = json.loads((target / "manifest.json").read_text())
+        except (OSError, ValueError):
+            manifest = None
+        if manifest is not None and verified(target, manifest):
+            return manifest
+        if directory_id(target) == before and not swapping(target):
+            return None
+        time.sleep(0.01)
+    return None
+
+
+def load_aggregates(source=None, directory=None, chunk_rows=DEFAULT_CHUNK_ROWS, workers=1):
+    """Load the survey's cube from the local aggregate cache, streaming ``source`` on the first run or once it changed."""
+    source = source or data_source()
+    manifest = read_aggregates_manifest(source, directory)
+    if manifest is None or source_changed(source, manifest):
+        manifest = ingest_aggregates(source, directory, chunk_rows, workers)
+    return AggregateCube.load(aggregates_dir(source, directory), version=manifest["version"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a survey CSV into its persisted aggregates.")
+    parser.add_argument("source", nargs="?", help="survey CSV path or URL (defaults to SURVEY_DATA_SOURCE)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--cache-dir", help="where aggregates are stored (defaults to SURVEY_CACHE_DIR)")
+    parser.add_argument("--workers", type=int, help="worker processes, 0 for one per core (defaults to SURVEY_WORKERS)")
+    args = parser.parse_args(argv)
+
+    manifest = ingest_aggregates(args.source or data_source(), args.cache_dir, args.chunk_rows,
+                                 worker_count(args.workers))
+    print(f"Aggregated {manifest['rows']:,} respondents in {manifest['chunks']} chunks "
+          f"into {aggregates_dir(manifest['source'], args.cache_dir)} (version {manifest['version']})")
+
+
+if __name__ == "__main__":
+    main()
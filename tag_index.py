@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from parallel import ordered_map
+
+
+# Semicolon-delimited multi-select columns of the survey
+MULTI_SELECT_COLUMNS = [
+    "LanguageWorkedWith", "LanguageDesireNextYear",
+    "DatabaseWorkedWith", "DatabaseDesireNextYear",
+    "PlatformWorkedWith", "PlatformDesireNextYear",
+    "WebFrameWorkedWith", "WebFrameDesireNextYear",
+    "MiscTechWorkedWith", "MiscTechDesireNextYear",
+]
+
+class TagIndex:
+    """Vocabulary and bit-packed respondent x tag membership of one column.
+
+    Row ``i`` of ``bits`` holds one bit per respondent for tag
+    ``vocabulary[i]``, so the respondents holding a tag are read from its row
+    instead of a string split over the whole survey.
+    """
+
+    def __init__(self, vocabulary, bits, n_rows):
+        self.vocabulary = vocabulary
+        self.bits = bits
+        self.n_rows = n_rows
+
+    @classmethod
+    def from_series(cls, values):
+        # Positional index so exploded entries map back to respondent rows
+        values = pd.Series(values.to_numpy(dtype=object))
+        tags = values.dropna().str.split(";").explode()
+        tags = tags[tags.notna() & (tags != "")]
+
+        codes = pd.Categorical(tags.to_numpy())
+        rows = tags.index.to_numpy()
+
+        bits = np.zeros((len(codes.categories), (len(values) + 7) // 8), dtype=np.uint8)
+        np.bitwise_or.at(bits, (codes.codes, rows >> 3), (128 >> (rows & 7)).astype(np.uint8))
+        return cls(pd.Index(codes.categories, name="tag"), bits, len(values))
+
+    def rows(self, code):
+        """Positions of the respondents holding the tag with vocabulary code ``code``."""
+        return np.flatnonzero(np.unpackbits(self.bits[code], count=self.n_rows))
+
+
+def build_tag_indexes(df, columns=MULTI_SELECT_COLUMNS, workers=1):
+    """Encode every multi-select column present in ``df`` once, keyed by column name.
+
+    The columns are independent, so with ``workers > 1`` they are encoded in
+    parallel worker processes.
+    """
+    present = [column for column in columns if column in df.columns]
+    indexes = ordered_map(TagIndex.from_series, (df[column] for column in present), workers)
+    return dict(zip(present, indexes))
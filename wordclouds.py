@@ -0,0 +1,55 @@
+import os
+import threading
+
+from analytics import aggregate
+from figure_cache import figure_key, png_payload
+
+
+# Word cloud figures of the app: figure name -> (multi-select column, title)
+WORDCLOUDS = {
+    "dashboard/platforms": ("PlatformWorkedWith", "Platforms Worked With"),
+    "future_technology_trends/platforms": ("PlatformDesireNextYear", "Desired Platforms"),
+}
+
+# Set to 1 to render the unfiltered word clouds in a background thread at startup
+PRERENDER_ENV = "PRERENDER_WORDCLOUDS"
+
+
+def wordcloud_png(counts, title):
+    """PNG bytes of a word cloud laid out from precomputed (tag, count) rows."""
+    # Imported here so pages without a word cloud never load Matplotlib or WordCloud
+    from matplotlib.figure import Figure
+    from wordcloud import WordCloud
+
+    frequencies = {tag: int(count) for tag, count in zip(counts["tag"], counts["count"]) if count > 0}
+    wordcloud = WordCloud(width=800, height=400).generate_from_frequencies(frequencies)
+
+    # Object-oriented Figure so rendering is safe outside the script thread
+    fig = Figure(figsize=(8, 4))
+    ax = fig.subplots()
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis("off")
+    ax.set_title(title)
+    return png_payload(fig)
+
+
+def render_wordcloud(source, name, filters=None):
+    _, title = WORDCLOUDS[name]
+    return wordcloud_png(aggregate(source, name, filters), title)
+
+
+def prerender_wordclouds(source, figures, filters=None):
+    """Render every word cloud for ``filters`` into the figure cache."""
+    for name, (column, _) in WORDCLOUDS.items():
+        if column in source and not aggregate(source, name, filters).empty:
+            figures.get_or_build(figure_key(name, source.version, filters),
+                                 lambda: render_wordcloud(source, name, filters))
+
+
+def start_prerender(source, figures):
+    """Pre-render the unfiltered word clouds off the request path when PRERENDER_WORDCLOUDS is set."""
+    if os.environ.get(PRERENDER_ENV, "0") in ("", "0"):
+        return None
+    thread = threading.Thread(target=prerender_wordclouds, args=(source, figures), name="wordcloud-prerender", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,64 @@
+"""Several yearly survey files, each reduced once to its own persisted aggregates.
+
+Years are configured as ``year=source`` pairs, e.g.
+
+    SURVEY_YEARS="2019=m1_survey_data.csv,2020=survey_2020.csv"
+
+Every year is streamed into an ``AggregateCube`` cached under its source, so
+adding a year only processes the new file; the files are expected to share
+the column names of the 2019 survey.
+"""
+import os
+
+from cube import AGE_LABELS
+from streaming import DEFAULT_CHUNK_ROWS, load_aggregates
+
+
+YEARS_ENV = "SURVEY_YEARS"
+
+
+def parse_years(text):
+    """``{year: source}`` from '2019=path,2020=url', oldest year first."""
+    years = {}
+    for entry in text.split(","):
+        if not entry.strip():
+            continue
+        year, separator, source = entry.partition("=")
+        if not separator or not source.strip():
+            raise ValueError(f"Expected year=source in {YEARS_ENV}, got {entry!r}")
+        years[int(year)] = source.strip()
+    return dict(sorted(years.items()))
+
+
+def survey_years():
+    return parse_years(os.environ.get(YEARS_ENV, ""))
+
+
+class SurveyYears:
+    """Aggregate cubes of several survey years, oldest first.
+
+    Offers the parts of the cube interface the UI needs (``version``,
+    ``options`` and column membership) across all years.
+    """
+
+    def __init__(self, cubes):
+        self.cubes = dict(sorted(cubes.items()))
+        self.version = "+".join(f"{year}:{cube.version}" for year, cube in self.cubes.items())
+
+    def __contains__(self, column):
+        return any(column in cube for cube in self.cubes.values())
+
+    def __len__(self):
+        return len(self.cubes)
+
+    def options(self, dimension):
+        values = {value for cube in self.cubes.values() for value in cube.options(dimension)}
+        if dimension == "AgeBand":
+            return [label for label in AGE_LABELS if label in values]
+        return sorted(values)
+
+
+def load_years(years=None, directory=None, chunk_rows=DEFAULT_CHUNK_ROWS, workers=1):
+    """Per-year cubes of ``years`` (defaults to SURVEY_YEARS), streaming only the years not cached yet."""
+    years = survey_years() if years is None else years
+    return SurveyYears({year: load_aggregates(source, directory, chunk_rows, workers) for year, source in years.items()})